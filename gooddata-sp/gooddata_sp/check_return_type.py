@@ -1,10 +1,10 @@
 import inspect
-import json
 from typing import Any
 
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 from pydantic import BaseModel
+from pydantic_core import to_json
 from starlette.responses import Response
 
 from gooddata_sp.app_config import app
@@ -87,6 +87,27 @@ def check_response(
     return _check_response_type(responses, out_response)
 
 
+def json_response(out_response: BaseModel, status_code: int = 200) -> Response:
+    """
+    Build a JSON Response for a model whose type is already known to be accepted by the route.
+
+    This skips the caller route lookup performed by check_response, so it must only be used
+    when the status code for the model type is known statically.
+
+    Args:
+        out_response: (BaseModel) The model to return as the response body.
+        status_code: (int, optional) The HTTP response code. Defaults to 200.
+
+    Returns:
+        starlette.responses.Response: A Response with the JSON serialization of out_response.
+    """  # noqa: E501
+    return Response(
+        status_code=status_code,
+        content=out_response.__pydantic_serializer__.to_json(out_response),
+        media_type="application/json",
+    )
+
+
 def _check_response_type(responses: dict, out_response: Any) -> Response:
     """
     Ensures that the type of the parameter 'out_response' is contained in the 'model'
@@ -126,14 +147,15 @@ def _check_response_type(responses: dict, out_response: Any) -> Response:
             media_type="application/json",
         )
 
+    # serialize straight to JSON bytes with pydantic-core, without an intermediate dict
+    content: str | bytes
     if isinstance(out_response, BaseModel):
-        content = json.dumps(out_response.model_dump())
+        content = out_response.__pydantic_serializer__.to_json(out_response)
         media_type = "application/json"
     elif isinstance(out_response, list) and all(
         isinstance(item, BaseModel) for item in out_response
     ):  # noqa: E501
-        out_response_dicts = [item.dict() for item in out_response]
-        content = json.dumps(out_response_dicts)
+        content = to_json(out_response, by_alias=False)
         media_type = "application/json"
     else:
         content = str(out_response)
@@ -1,5 +1,10 @@
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache, partial
+from typing import AbstractSet, Any, Callable, Collection, Dict, List, Optional, Sequence, Tuple
 
+from gooddata_api_client.exceptions import NotFoundException
+from gooddata_api_client.rest import RESTClientObject
 from gooddata_sdk import (
     BasicCredentials,
     CatalogAssigneeIdentifier,
@@ -10,6 +15,8 @@ from gooddata_sdk import (
     CatalogDataSourceSnowflake,
     CatalogDeclarativeDataset,
     CatalogDeclarativeSingleWorkspacePermission,
+    CatalogDeclarativeUserDataFilter,
+    CatalogDeclarativeUserDataFilters,
     CatalogDeclarativeWorkspaceModel,
     CatalogDeclarativeWorkspacePermissions,
     CatalogFact,
@@ -19,15 +26,14 @@ from gooddata_sdk import (
     CatalogPermissionAssignments,
     CatalogScanModelRequest,
     CatalogUser,
-    CatalogUserDataFilter,
-    CatalogUserDataFilterAttributes,
-    CatalogUserDataFilterRelationships,
     CatalogUserGroup,
     CatalogWorkspace,
     CatalogWorkspaceContent,
     GoodDataSdk,
     SnowflakeAttributes,
 )
+from gooddata_sdk.catalog.identifier import CatalogUserIdentifier
+from urllib3.util.retry import Retry
 
 from gooddata_sp.models.config import GoodDataConfig, SnowflakeConfig
 from gooddata_sp.models.gooddata import UserDataFilter
@@ -36,14 +42,36 @@ from gooddata_sp.utility.logger import get_logger
 
 logger = get_logger(__name__)
 
+# how long the witboost -> GoodData identity maps are reused before listing users/groups again
+DEFAULT_IDENTITY_CACHE_TTL_SECONDS = 300.0
+# max number of kept-alive connections to the GoodData host, ie the max number of parallel requests
+DEFAULT_CONNECTION_POOL_MAXSIZE = 32
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.2
+# max number of independent GoodData requests issued concurrently by a single operation
+DEFAULT_MAX_PARALLEL_REQUESTS = 16
+
+MAQL_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 class GoodDataClient:
     _gooddata_config: GoodDataConfig
     _snowflake_config: SnowflakeConfig
     _sdk: GoodDataSdk
+    _identity_cache_ttl: float
+    _user_map_cache: Optional[Tuple[float, Dict[str, str]]]
+    _group_map_cache: Optional[Tuple[float, Dict[str, str]]]
+    _max_parallel_requests: int
 
     def __init__(
-        self, gooddata_config: GoodDataConfig, snowflake_config: SnowflakeConfig
+        self,
+        gooddata_config: GoodDataConfig,
+        snowflake_config: SnowflakeConfig,
+        identity_cache_ttl: float = DEFAULT_IDENTITY_CACHE_TTL_SECONDS,
+        connection_pool_maxsize: int = DEFAULT_CONNECTION_POOL_MAXSIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+        max_parallel_requests: int = DEFAULT_MAX_PARALLEL_REQUESTS,
     ):
         self._gooddata_config = gooddata_config
         self._snowflake_config = snowflake_config
@@ -51,14 +79,38 @@ class GoodDataClient:
             self._gooddata_config.host.rstrip("/"),
             self._gooddata_config.token.get_secret_value(),
         )
-
-    def create_snowflake_datasource(
-        self, id: str, name: str, database: str, schema: str
-    ) -> CatalogDataSource:
-        credentials = BasicCredentials(
+        self._configure_connection_pool(
+            maxsize=connection_pool_maxsize,
+            retries=Retry(total=max_retries, backoff_factor=retry_backoff_factor),
+        )
+        self._identity_cache_ttl = identity_cache_ttl
+        self._user_map_cache = None
+        self._group_map_cache = None
+        self._max_parallel_requests = max_parallel_requests
+
+    def _configure_connection_pool(self, maxsize: int, retries: Retry) -> None:
+        # the SDK builds its urllib3 pool manager (which keeps connections alive) from the api client
+        # configuration at creation time and exposes no hook for it, so the rest client is rebuilt to pick
+        # up the pool settings. This relies on SDK internals, hence the fallback to the default pool
+        api_client = getattr(self._sdk.client, "_api_client", None)
+        if api_client is None or not hasattr(api_client, "configuration") or not hasattr(api_client, "rest_client"):
+            logger.warning("GoodData SDK client internals changed, keeping its default connection pool settings")
+            return None
+        configuration = api_client.configuration
+        configuration.connection_pool_maxsize = maxsize
+        configuration.retries = retries
+        api_client.rest_client = RESTClientObject(configuration)
+
+    @cached_property
+    def _snowflake_credentials(self) -> BasicCredentials:
+        return BasicCredentials(
             username=self._snowflake_config.user,
             password=self._snowflake_config.password.get_secret_value(),
         )
+
+    def create_snowflake_datasource(
+        self, id: str, name: str, database: str, schema: str, refresh: bool = False
+    ) -> CatalogDataSource:
         snowflake_database_attributes = SnowflakeAttributes(
             account=self._snowflake_config.account,
             warehouse=self._snowflake_config.warehouse,
@@ -68,14 +120,17 @@ class GoodDataClient:
         data_source = CatalogDataSourceSnowflake(
             id=id,
             name=name,
-            credentials=credentials,
+            credentials=self._snowflake_credentials,
             schema=schema,
             db_specific_attributes=snowflake_database_attributes,
         )
         self._sdk.catalog_data_source.create_or_update_data_source(
             data_source=data_source
         )
-        return self._sdk.catalog_data_source.get_data_source(data_source_id=id)
+        # the data source is fully determined by what we just sent, re-read it only if asked to
+        if refresh:
+            return self._sdk.catalog_data_source.get_data_source(data_source_id=id)
+        return data_source
 
     def generate_ldm_and_apply_to_workspace(
         self,
@@ -88,24 +143,21 @@ class GoodDataClient:
         pdm = self._sdk.catalog_data_source.scan_data_source(
             data_source_id=data_source.id, scan_request=scan_request
         )
-        logger.info("Scanned PDM: " + str(pdm))
+        logger.info(
+            "Scanned PDM for data source %s: %d tables", data_source.id, len(pdm.pdm.tables)
+        )
+        logger.debug("Scanned PDM: %s", pdm)
 
         if len(pdm.warnings) > 0:
             logger.warn(
-                "PDM scan for data source "
-                + data_source.id
-                + " returned warnings: "
-                + str(pdm.warnings)
+                "PDM scan for data source %s returned warnings: %s", data_source.id, pdm.warnings
             )
 
         # filter out everything that's not from the component at hand
-        object_names = list(
-            map(lambda object: object.name.upper(), snowflake_metadata.objects)
-        )
-        filtered_tables = list(
-            filter(lambda t: t.id.upper() in object_names, pdm.pdm.tables)
-        )
-        logger.info("Filtered tables: " + str(filtered_tables))
+        object_names = frozenset(o.name.upper() for o in snowflake_metadata.objects)
+        filtered_tables = [t for t in pdm.pdm.tables if t.id.upper() in object_names]
+        logger.info("Filtered tables: %s", [t.id for t in filtered_tables])
+        logger.debug("Filtered tables: %s", filtered_tables)
 
         # build ldm generate request
         pdm_request = CatalogPdmLdmRequest(tables=filtered_tables)
@@ -117,7 +169,7 @@ class GoodDataClient:
         generated_ldm = self._sdk.catalog_data_source.generate_logical_model(
             data_source_id=data_source.id, generate_ldm_request=ldm_request
         )
-        logger.info("Generated LDM: " + str(generated_ldm))
+        logger.debug("Generated LDM: %s", generated_ldm)
 
         # merge with existing ldm
         # TODO actually merge, we just replace for now, but merge is needed to support multiple dependent components
@@ -125,7 +177,7 @@ class GoodDataClient:
             workspace_id=workspace_id
         )
         current_ldm = current_cdm.ldm
-        logger.info("Current LDM: " + str(current_ldm))
+        logger.debug("Current LDM: %s", current_ldm)
         updated_cdm = generated_ldm
 
         self._sdk.catalog_workspace_content.put_declarative_ldm(
@@ -137,73 +189,97 @@ class GoodDataClient:
         self, data_source_id: str, user_ids: List[str], group_ids: List[str], level: str
     ) -> None:
         logger.info(
-            "Updating permissions for data source "
-            + str(data_source_id)
-            + " for users "
-            + str(user_ids)
-            + " and groups "
-            + str(group_ids)
-            + " to "
-            + level
-        )
-        for user_id in user_ids:
-            current_permissions = self._sdk.catalog_user.get_user_permissions(
-                user_id=user_id
-            )
-            logger.info("Current user permissions: " + str(current_permissions))
-
-            # compute updated permissions
-            current_data_source_permissions = current_permissions.data_sources
-            filtered_data_source_permissions = [
-                p for p in current_data_source_permissions if p.id != data_source_id
-            ]
-            new_data_source_permission = CatalogDataSourcePermissionAssignment(
-                id=data_source_id, permissions=[level]
-            )
-            updated_data_source_permissions = filtered_data_source_permissions + [
-                new_data_source_permission
-            ]
-            updated_permissions = CatalogPermissionAssignments(
-                workspaces=current_permissions.workspaces,
-                data_sources=updated_data_source_permissions,
-            )
+            "Updating permissions for data source %s for users %s and groups %s to %s",
+            data_source_id,
+            user_ids,
+            group_ids,
+            level,
+        )
+        tasks = [
+            partial(self._set_user_data_source_permissions, user_id, data_source_id, level)
+            for user_id in user_ids
+        ] + [
+            partial(self._set_group_data_source_permissions, group_id, data_source_id, level)
+            for group_id in group_ids
+        ]
+        self._run_in_parallel(tasks)
 
-            logger.info("Updated user permissions: " + str(updated_permissions))
-            self._sdk.catalog_user.manage_user_permissions(
-                user_id=user_id, permission_assignments=updated_permissions
-            )
+    def _set_user_data_source_permissions(
+        self, user_id: str, data_source_id: str, level: str
+    ) -> None:
+        current_permissions = self._sdk.catalog_user.get_user_permissions(
+            user_id=user_id
+        )
+        logger.debug("Current user permissions: %s", current_permissions)
 
-        for group_id in group_ids:
-            current_permissions = self._sdk.catalog_user.get_user_group_permissions(
-                user_group_id=group_id
-            )
-            logger.info("Current group permissions: " + str(current_permissions))
-
-            # compute updated permissions
-            current_data_source_permissions = current_permissions.data_sources
-            filtered_data_source_permissions = [
-                p for p in current_data_source_permissions if p.id != data_source_id
-            ]
-            new_data_source_permission = CatalogDataSourcePermissionAssignment(
-                id=data_source_id, permissions=[level]
-            )
-            updated_data_source_permissions = filtered_data_source_permissions + [
-                new_data_source_permission
-            ]
-            updated_permissions = CatalogPermissionAssignments(
-                workspaces=current_permissions.workspaces,
-                data_sources=updated_data_source_permissions,
-            )
+        updated_permissions = self._upsert_data_source_permission(
+            current_permissions, data_source_id, level
+        )
 
-            logger.info("Updated group permissions: " + str(updated_permissions))
-            self._sdk.catalog_user.manage_user_group_permissions(
-                user_group_id=group_id, permission_assignments=updated_permissions
-            )
+        logger.debug("Updated user permissions: %s", updated_permissions)
+        self._sdk.catalog_user.manage_user_permissions(
+            user_id=user_id, permission_assignments=updated_permissions
+        )
+
+    def _set_group_data_source_permissions(
+        self, group_id: str, data_source_id: str, level: str
+    ) -> None:
+        current_permissions = self._sdk.catalog_user.get_user_group_permissions(
+            user_group_id=group_id
+        )
+        logger.debug("Current group permissions: %s", current_permissions)
+
+        updated_permissions = self._upsert_data_source_permission(
+            current_permissions, data_source_id, level
+        )
+
+        logger.debug("Updated group permissions: %s", updated_permissions)
+        self._sdk.catalog_user.manage_user_group_permissions(
+            user_group_id=group_id, permission_assignments=updated_permissions
+        )
+
+    @staticmethod
+    def _upsert_data_source_permission(
+        current_permissions: CatalogPermissionAssignments, data_source_id: str, level: str
+    ) -> CatalogPermissionAssignments:
+        # replace the permission on the data source if present, add it otherwise;
+        # the assignments just read are updated in place and sent back as they are
+        permissions_by_data_source_id = {p.id: p for p in current_permissions.data_sources}
+        permissions_by_data_source_id[data_source_id] = CatalogDataSourcePermissionAssignment(
+            id=data_source_id, permissions=[level]
+        )
+        current_permissions.data_sources = list(permissions_by_data_source_id.values())
+        return current_permissions
+
+    def _run_in_parallel(self, tasks: Sequence[Callable[[], Any]]) -> None:
+        """
+        Runs independent SDK calls concurrently on a thread pool and waits for all of them.
+
+        Every task is run to completion even if some of them fail; failures are logged and
+        the first one is raised once all tasks are done.
+        """
+        if len(tasks) == 0:
+            return None
+
+        errors: List[BaseException] = []
+        with ThreadPoolExecutor(max_workers=min(self._max_parallel_requests, len(tasks))) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    logger.error("Parallel GoodData request failed: %s", error)
+                    errors.append(error)
+
+        if len(errors) > 0:
+            raise errors[0]
+        return None
 
     def workspace_exists(self, id: str) -> bool:
-        workspaces = self._sdk.catalog_workspace.list_workspaces()
-        workspace_ids = map(lambda x: x.id, workspaces)
-        return id in workspace_ids
+        try:
+            self._sdk.catalog_workspace.get_workspace(workspace_id=id)
+            return True
+        except NotFoundException:
+            return False
 
     def create_workspace(
         self, id: str, name: str, parent: Optional[str]
@@ -221,7 +297,7 @@ class GoodDataClient:
         return self._sdk.catalog_workspace.put_declarative_workspace(id, content)
 
     def empty_workspace(self, id: str) -> None:
-        return self._sdk.catalog_workspace.put_declarative_workspace(id, EMPTY_CONTENT)
+        return self._sdk.catalog_workspace.put_declarative_workspace(id, _empty_content())
 
     def delete_workspace(self, id: str) -> None:
         self._sdk.catalog_workspace.delete_workspace(id)
@@ -234,19 +310,15 @@ class GoodDataClient:
                 workspace_id=workspace_id
             )
         )
-        logger.info(
-            "Existing permissions for workspace "
-            + workspace_id
-            + ": "
-            + str(existing_catalog_permissions)
+        logger.debug(
+            "Existing permissions for workspace %s: %s", workspace_id, existing_catalog_permissions
         )
 
         # compute updated permissions
         existing_permissions = existing_catalog_permissions.permissions
+        updated_assignee_ids = set(user_ids).union(group_ids)
         filtered_existing_permissions = [
-            x
-            for x in existing_permissions
-            if x.assignee.id not in user_ids and x.assignee.id not in group_ids
+            x for x in existing_permissions if x.assignee.id not in updated_assignee_ids
         ]
         additional_user_permissions = [
             CatalogDeclarativeSingleWorkspacePermission(
@@ -271,11 +343,8 @@ class GoodDataClient:
             hierarchy_permissions=existing_catalog_permissions.hierarchy_permissions,
         )
 
-        logger.info(
-            "New permissions for workspace "
-            + workspace_id
-            + ": "
-            + str(new_catalog_permissions)
+        logger.debug(
+            "New permissions for workspace %s: %s", workspace_id, new_catalog_permissions
         )
         self._sdk.catalog_permission.put_declarative_permissions(
             workspace_id, new_catalog_permissions
@@ -287,11 +356,8 @@ class GoodDataClient:
                 workspace_id=workspace_id
             )
         )
-        logger.info(
-            "Existing permissions for workspace "
-            + workspace_id
-            + ":"
-            + str(existing_catalog_permissions)
+        logger.debug(
+            "Existing permissions for workspace %s: %s", workspace_id, existing_catalog_permissions
         )
 
         # compute updated (ie empty) permissions
@@ -300,119 +366,67 @@ class GoodDataClient:
             hierarchy_permissions=existing_catalog_permissions.hierarchy_permissions,
         )
 
-        logger.info(
-            "New permissions for workspace "
-            + workspace_id
-            + ":"
-            + str(new_catalog_permissions)
+        logger.debug(
+            "New permissions for workspace %s: %s", workspace_id, new_catalog_permissions
         )
         self._sdk.catalog_permission.put_declarative_permissions(
             workspace_id, new_catalog_permissions
         )
 
-    def add_user_data_filter(
-        self, user_data_filter: UserDataFilter, workspace_id: str
-    ) -> CatalogUserDataFilter:
-        witboost_user = user_data_filter.user
-        gooddata_user = self.map_users(witboost_users=[witboost_user]).get(
-            witboost_user
-        )
-        if gooddata_user is None:
+    def set_user_data_filters(
+        self, user_data_filters: List[UserDataFilter], workspace_id: str
+    ) -> None:
+        """
+        Replaces every User Data Filter of the workspace with the given ones in a single request.
+
+        Filters of the workspace that are not in the list are removed, so an empty list removes them all.
+        """
+        witboost_users = [user_data_filter.user for user_data_filter in user_data_filters]
+        mapped_users = self.map_users(witboost_users=witboost_users) if witboost_users else {}
+        gooddata_users = {
+            user: gooddata_user for user, gooddata_user in mapped_users.items() if gooddata_user is not None
+        }
+        unmapped_users = [user for user in witboost_users if user not in gooddata_users]
+        if len(unmapped_users) > 0:
             raise ValueError(
-                "Unable to map User Data Filter user "
-                + witboost_user
-                + " to a GoodData user."
-            )
-
-        user_data_filter_relationships = (
-            CatalogUserDataFilterRelationships.create_user_user_group_relationship(
-                user_id=gooddata_user
+                "Unable to map User Data Filter users "
+                + str(unmapped_users)
+                + " to GoodData users."
             )
-        )
-        operator = (
-            "=" if user_data_filter.operator is None else user_data_filter.operator
-        )
-        maql = (
-            "{label/"
-            + user_data_filter.label
-            + "} "
-            + operator
-            + ' "'
-            + user_data_filter.value
-            + '"'
-        )
-        user_data_filter_attributes = CatalogUserDataFilterAttributes(
-            maql=maql, title=user_data_filter.title
-        )
-        gooddata_user_data_filter = CatalogUserDataFilter(
-            id=user_data_filter.id,
-            attributes=user_data_filter_attributes,
-            relationships=user_data_filter_relationships,
-        )
-
-        self._sdk.catalog_workspace.create_or_update_user_data_filter(
-            workspace_id=workspace_id, user_data_filter=gooddata_user_data_filter
-        )
 
-        return gooddata_user_data_filter
-
-    def remove_user_data_filter_if_exists(
-        self, user_data_filter_id: str, workspace_id: str
-    ) -> None:
-        user_data_filters = self._sdk.catalog_workspace.list_user_data_filters(
-            workspace_id=workspace_id
-        )
-
-        matching_user_data_filters = [
-            udf for udf in user_data_filters if udf.id == user_data_filter_id
-        ]
-
-        if len(matching_user_data_filters) > 0:
-            self._sdk.catalog_workspace.delete_user_data_filter(
-                user_data_filter_id=user_data_filter_id, workspace_id=workspace_id
-            )
-        else:
-            logger.warn(
-                "User Data Filter with id "
-                + user_data_filter_id
-                + " not found, skipping deletion"
+        declarative_user_data_filters = []
+        for user_data_filter in user_data_filters:
+            logger.info("Applying User Data Filter %s to workspace %s", user_data_filter, workspace_id)
+            declarative_user_data_filters.append(
+                CatalogDeclarativeUserDataFilter(
+                    id=user_data_filter.id,
+                    title=user_data_filter.title,
+                    maql=self._user_data_filter_maql(user_data_filter),
+                    user=CatalogUserIdentifier(id=gooddata_users[user_data_filter.user], type="user"),
+                )
             )
 
-        return None
-
-    def remove_user_data_filters(self, workspace_id: str) -> None:
-        user_data_filters = self._sdk.catalog_workspace.list_user_data_filters(
-            workspace_id=workspace_id
+        self._sdk.catalog_workspace.put_declarative_user_data_filters(
+            workspace_id=workspace_id,
+            user_data_filters=CatalogDeclarativeUserDataFilters(user_data_filters=declarative_user_data_filters),
         )
 
-        for udf in user_data_filters:
-            udf_id = udf.id
-            if udf_id is not None:
-                self._sdk.catalog_workspace.delete_user_data_filter(
-                    user_data_filter_id=udf_id, workspace_id=workspace_id
-                )
-            else:  # how would this happen?
-                logger.warn(
-                    "User Data Filter without id found in workspace "
-                    + workspace_id
-                    + ": "
-                    + str(udf)
-                )
-
     def get_full_catalog(self, workspace_id: str) -> CatalogWorkspaceContent:
         return self._sdk.catalog_workspace_content.get_full_catalog(workspace_id)
 
+    # metrics, attributes and facts load only the requested entities; the SDK has no datasets-only call
+
     def get_datasets(self, workspace_id: str) -> list[CatalogDataset]:
         return self.get_full_catalog(workspace_id).datasets
 
     def get_metrics(self, workspace_id: str) -> list[CatalogMetric]:
-        return self.get_full_catalog(workspace_id).metrics
+        return self._sdk.catalog_workspace_content.get_metrics_catalog(workspace_id)
 
     def get_attributes(self, workspace_id: str) -> list[CatalogAttribute]:
-        return self.get_full_catalog(workspace_id).attributes
+        return self._sdk.catalog_workspace_content.get_attributes_catalog(workspace_id)
 
     def get_facts(self, workspace_id: str) -> list[CatalogFact]:
-        return self.get_full_catalog(workspace_id).facts
+        return self._sdk.catalog_workspace_content.get_facts_catalog(workspace_id)
 
     def get_host(self) -> str:
         return self._gooddata_config.host
@@ -423,77 +437,112 @@ class GoodDataClient:
     def get_groups(self) -> List[CatalogUserGroup]:
         return self._sdk.catalog_user.list_user_groups()
 
-    def map_users(self, witboost_users: List[str]) -> Dict[str, str | None]:
-        catalog_users = self.get_users()
+    def invalidate_user_cache(self) -> None:
+        self._user_map_cache = None
 
-        # create a map from witboost-style user refs to gooddata user ids
-        witboost_users_to_gooddata_id = {}
-        for catalog_user in catalog_users:
-            try:
-                email = catalog_user.attributes.email  # type: ignore
-            except AttributeError:
-                email = None
-
-            if email is None:
-                logger.warn("GoodData user " + str(catalog_user) + " is missing email")
-            else:
-                key = "user:" + email.replace("@", "_")
-                value = catalog_user.id
-                witboost_users_to_gooddata_id[key] = value
+    def invalidate_group_cache(self) -> None:
+        self._group_map_cache = None
+
+    def map_users(self, witboost_users: List[str]) -> Dict[str, str | None]:
+        witboost_users_to_gooddata_id = self._get_witboost_users_to_gooddata_id(witboost_users)
 
         # map identities
-        mapped_identities = {}
-        for witboost_user in witboost_users:
-            gooddata_id = witboost_users_to_gooddata_id.get(witboost_user)
-
-            if gooddata_id is None:
-                logger.warn(
-                    "Witboost user "
-                    + witboost_user
-                    + " could not be mapped to a GoodData user"
-                )
+        mapped_identities = {
+            witboost_user: witboost_users_to_gooddata_id.get(witboost_user)
+            for witboost_user in witboost_users
+        }
 
-            mapped_identities[witboost_user] = gooddata_id
+        unmapped_identities = [k for k, v in mapped_identities.items() if v is None]
+        if len(unmapped_identities) > 0:
+            logger.warn(
+                "Witboost users %s could not be mapped to GoodData users", unmapped_identities
+            )
 
         return mapped_identities
 
     def map_groups(self, witboost_groups: List[str]) -> Dict[str, str | None]:
-        catalog_groups = self.get_groups()
-
-        # create a map from witboost-style group refs to gooddata group ids
-        witboost_groups_to_gooddata_id = {}
-        for catalog_group in catalog_groups:
-            try:
-                name = catalog_group.name  # type: ignore
-            except AttributeError:
-                name = None
-
-            if name is None:
-                logger.warn("GoodData group " + str(catalog_group) + " is missing name")
-            else:
-                key = "group:" + name
-                value = catalog_group.id
-                witboost_groups_to_gooddata_id[key] = value
+        witboost_groups_to_gooddata_id = self._get_witboost_groups_to_gooddata_id(witboost_groups)
 
         # map identities
-        mapped_identities = {}
-        for witboost_group in witboost_groups:
-            gooddata_id = witboost_groups_to_gooddata_id.get(witboost_group)
-
-            if gooddata_id is None:
-                logger.warn(
-                    "Witboost group "
-                    + witboost_group
-                    + " could not be mapped to a GoodData group"
-                )
+        mapped_identities = {
+            witboost_group: witboost_groups_to_gooddata_id.get(witboost_group)
+            for witboost_group in witboost_groups
+        }
 
-            mapped_identities[witboost_group] = gooddata_id
+        unmapped_identities = [k for k, v in mapped_identities.items() if v is None]
+        if len(unmapped_identities) > 0:
+            logger.warn(
+                "Witboost groups %s could not be mapped to GoodData groups", unmapped_identities
+            )
 
         return mapped_identities
 
+    def _get_witboost_users_to_gooddata_id(self, witboost_users: Collection[str]) -> Dict[str, str]:
+        # a cached map missing any of the requested users is listed again, as they may have been created since
+        cache = self._user_map_cache
+        if (
+            cache is not None
+            and time.monotonic() - cache[0] < self._identity_cache_ttl
+            and all(witboost_user in cache[1] for witboost_user in witboost_users)
+        ):
+            return cache[1]
+
+        catalog_users = self.get_users()
+
+        # create a map from witboost-style user refs to gooddata user ids
+        witboost_users_to_gooddata_id = {
+            "user:" + catalog_user.attributes.email.replace("@", "_"): catalog_user.id
+            for catalog_user in catalog_users
+            if catalog_user.attributes is not None and catalog_user.attributes.email
+        }
+        users_missing_email = [
+            u.id for u in catalog_users if u.attributes is None or not u.attributes.email
+        ]
+        if len(users_missing_email) > 0:
+            logger.warn("GoodData users %s are missing email", users_missing_email)
+
+        self._user_map_cache = (time.monotonic(), witboost_users_to_gooddata_id)
+        return witboost_users_to_gooddata_id
+
+    def _get_witboost_groups_to_gooddata_id(self, witboost_groups: Collection[str]) -> Dict[str, str]:
+        # a cached map missing any of the requested groups is listed again, as they may have been created since
+        cache = self._group_map_cache
+        if (
+            cache is not None
+            and time.monotonic() - cache[0] < self._identity_cache_ttl
+            and all(witboost_group in cache[1] for witboost_group in witboost_groups)
+        ):
+            return cache[1]
+
+        catalog_groups = self.get_groups()
+
+        # create a map from witboost-style group refs to gooddata group ids
+        witboost_groups_to_gooddata_id = {
+            "group:" + catalog_group.name: catalog_group.id
+            for catalog_group in catalog_groups
+            if catalog_group.name
+        }
+        groups_missing_name = [g.id for g in catalog_groups if not g.name]
+        if len(groups_missing_name) > 0:
+            logger.warn("GoodData groups %s are missing name", groups_missing_name)
+
+        self._group_map_cache = (time.monotonic(), witboost_groups_to_gooddata_id)
+        return witboost_groups_to_gooddata_id
+
+    @classmethod
+    def _default_operator(cls, operator: Optional[str]) -> str:
+        return "=" if operator is None else operator
+
+    @classmethod
+    def _user_data_filter_maql(cls, user_data_filter: UserDataFilter) -> str:
+        operator = cls._default_operator(user_data_filter.operator)
+        # escape backslashes and double quotes so the value can't break out of the MAQL string literal
+        value = user_data_filter.value.translate(MAQL_STRING_ESCAPES)
+        return f'{{label/{user_data_filter.label}}} {operator} "{value}"'
+
     @classmethod
     def _check_dataset_name(
-        cls, dataset: CatalogDeclarativeDataset, object_names: List[str]
+        cls, dataset: CatalogDeclarativeDataset, object_names: AbstractSet[str]
     ) -> bool:
         if dataset.data_source_table_id is not None:
             return dataset.data_source_table_id.id in object_names
@@ -501,18 +550,20 @@ class GoodDataClient:
             return False
 
 
-# contents of an empty workspace
-EMPTY_CONTENT = CatalogDeclarativeWorkspaceModel.from_dict(
-    {
-        "analytics": {
-            "analyticalDashboardExtensions": [],
-            "analyticalDashboards": [],
-            "attributeHierarchies": [],
-            "dashboardPlugins": [],
-            "filterContexts": [],
-            "metrics": [],
-            "visualizationObjects": [],
-        },
-        "ldm": {"datasets": [], "dateInstances": []},
-    }
-)
+@lru_cache(maxsize=1)
+def _empty_content() -> CatalogDeclarativeWorkspaceModel:
+    # contents of an empty workspace, built on first use to keep SDK model parsing out of import time
+    return CatalogDeclarativeWorkspaceModel.from_dict(
+        {
+            "analytics": {
+                "analyticalDashboardExtensions": [],
+                "analyticalDashboards": [],
+                "attributeHierarchies": [],
+                "dashboardPlugins": [],
+                "filterContexts": [],
+                "metrics": [],
+                "visualizationObjects": [],
+            },
+            "ldm": {"datasets": [], "dateInstances": []},
+        }
+    )
@@ -1,7 +1,7 @@
 import os
+from functools import lru_cache
 from typing import Annotated, Optional, Tuple
 
-import yaml
 from fastapi import Depends
 
 from gooddata_sp.client.gooddata_client import GoodDataClient
@@ -13,9 +13,10 @@ from gooddata_sp.models.api_models import (
 )
 from gooddata_sp.models.config import GoodDataConfig, SnowflakeConfig, SpecificProvisionerConfig
 from gooddata_sp.models.data_product_descriptor import DataProduct
+from gooddata_sp.models.gooddata import GoodDataOutputPort
 from gooddata_sp.service.gooddata_service import GoodDataService
 from gooddata_sp.utility.logger import get_logger
-from gooddata_sp.utility.parsing_pydantic_models import parse_yaml_with_model
+from gooddata_sp.utility.parsing_pydantic_models import parse_yaml_with_model, safe_load_yaml
 
 logger = get_logger(__name__)
 
@@ -53,7 +54,7 @@ async def unpack_provisioning_request(
         )
         return ValidationError(errors=[error])
     try:
-        descriptor_dict = yaml.safe_load(provisioning_request.descriptor)
+        descriptor_dict = safe_load_yaml(provisioning_request.descriptor)
         data_product = parse_yaml_with_model(descriptor_dict.get("dataProduct"), DataProduct)
         component_to_provision = descriptor_dict.get("componentIdToProvision")
 
@@ -150,7 +151,7 @@ async def unpack_update_acl_request(
     """  # noqa: E501
 
     try:
-        request = yaml.safe_load(update_acl_request.provisionInfo.request)
+        request = safe_load_yaml(update_acl_request.provisionInfo.request)
         data_product = parse_yaml_with_model(request.get("dataProduct"), DataProduct)
         component_to_provision = request.get("componentIdToProvision")
         if isinstance(data_product, DataProduct):
@@ -177,7 +178,109 @@ UnpackedUpdateAclRequestDep = Annotated[
 ]
 
 
+def get_gooddata_component(data_product: DataProduct, component_id: str) -> GoodDataOutputPort | ValidationError:
+    """
+    Builds the typed GoodData Output Port for the component to provision.
+
+    Args:
+        data_product (DataProduct): The data product containing the component.
+        component_id (str): The id of the component to provision.
+
+    Returns:
+        GoodDataOutputPort | ValidationError: The typed component, or a `ValidationError` if the component
+            is missing or is not a valid GoodData Output Port.
+    """  # noqa: E501
+    try:
+        return data_product.get_typed_component_by_id(component_id, GoodDataOutputPort)
+    except ValueError as ex:
+        return ValidationError(errors=["Component is not of expected type.", str(ex)])
+
+
+async def unpack_gooddata_provisioning_request(
+    unpacked_request: UnpackedProvisioningRequestDep,
+) -> Tuple[DataProduct, GoodDataOutputPort] | ValidationError:
+    """
+    Unpacks a Provisioning Request for a GoodData Output Port, building the typed component once per request.
+
+    Returns:
+        Union[Tuple[DataProduct, GoodDataOutputPort], ValidationError]:
+            - If successful, returns a tuple containing the data product and the typed component to provision.
+            - If unsuccessful, returns a `ValidationError` object with error details.
+    """  # noqa: E501
+    if isinstance(unpacked_request, ValidationError):
+        return unpacked_request
+
+    data_product, component_id = unpacked_request
+    component = get_gooddata_component(data_product, component_id)
+    if isinstance(component, ValidationError):
+        return component
+    return data_product, component
+
+
+UnpackedGoodDataProvisioningRequestDep = Annotated[
+    Tuple[DataProduct, GoodDataOutputPort] | ValidationError,
+    Depends(unpack_gooddata_provisioning_request),
+]
+
+
+async def unpack_gooddata_unprovisioning_request(
+    unpacked_request: UnpackedUnprovisioningRequestDep,
+) -> Tuple[DataProduct, GoodDataOutputPort, bool] | ValidationError:
+    """
+    Unpacks an Unprovisioning Request for a GoodData Output Port, building the typed component once per request.
+
+    Returns:
+        Union[Tuple[DataProduct, GoodDataOutputPort, bool], ValidationError]:
+            - If successful, returns a tuple containing the data product, the typed component to unprovision
+              and the value of the removeData field.
+            - If unsuccessful, returns a `ValidationError` object with error details.
+    """  # noqa: E501
+    if isinstance(unpacked_request, ValidationError):
+        return unpacked_request
+
+    data_product, component_id, remove_data = unpacked_request
+    component = get_gooddata_component(data_product, component_id)
+    if isinstance(component, ValidationError):
+        return component
+    return data_product, component, remove_data
+
+
+UnpackedGoodDataUnprovisioningRequestDep = Annotated[
+    Tuple[DataProduct, GoodDataOutputPort, bool] | ValidationError,
+    Depends(unpack_gooddata_unprovisioning_request),
+]
+
+
+async def unpack_gooddata_update_acl_request(
+    unpacked_request: UnpackedUpdateAclRequestDep,
+) -> Tuple[DataProduct, GoodDataOutputPort, list[str]] | ValidationError:
+    """
+    Unpacks an Update ACL Request for a GoodData Output Port, building the typed component once per request.
+
+    Returns:
+        Union[Tuple[DataProduct, GoodDataOutputPort, List[str]], ValidationError]:
+            - If successful, returns a tuple containing the data product, the typed component and the list of references.
+            - If unsuccessful, returns a `ValidationError` object with error details.
+    """  # noqa: E501
+    if isinstance(unpacked_request, ValidationError):
+        return unpacked_request
+
+    data_product, component_id, refs = unpacked_request
+    component = get_gooddata_component(data_product, component_id)
+    if isinstance(component, ValidationError):
+        return component
+    return data_product, component, refs
+
+
+UnpackedGoodDataUpdateAclRequestDep = Annotated[
+    Tuple[DataProduct, GoodDataOutputPort, list[str]] | ValidationError,
+    Depends(unpack_gooddata_update_acl_request),
+]
+
+
+@lru_cache(maxsize=1)
 def get_specific_provisioner_config_from_env() -> SpecificProvisionerConfig:
+    # environment variables don't change during the process lifetime, so the config is built only once
     config = SpecificProvisionerConfig(
         gooddata_config=GoodDataConfig(
             host=get_env("GOODDATA_HOST"),
@@ -192,7 +295,7 @@ def get_specific_provisioner_config_from_env() -> SpecificProvisionerConfig:
             port=get_env("SNOWFLAKE_PORT", "443"),
         )
     )
-    logger.debug("Config: " + str(config))
+    logger.debug("Config: %s", config)
     return config
 
 
@@ -202,7 +305,9 @@ SpecificProvisionerConfigDep = Annotated[
 ]
 
 
+@lru_cache(maxsize=1)
 def get_gooddata_client(specific_provisioner_config: SpecificProvisionerConfigDep) -> GoodDataClient:
+    # a single client is shared by all requests, so its connection pool and caches outlive a request
     return GoodDataClient(gooddata_config=specific_provisioner_config.gooddata_config,
                           snowflake_config=specific_provisioner_config.snowflake_config)
 
@@ -213,6 +318,7 @@ GoodDataClientDep = Annotated[
 ]
 
 
+@lru_cache(maxsize=1)
 def get_gooddata_service(gooddata_client: GoodDataClientDep) -> GoodDataService:
     return GoodDataService(gooddata_client=gooddata_client)
 
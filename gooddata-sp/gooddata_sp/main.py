@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+
 from starlette.responses import Response
 
 from gooddata_sp.app_config import app
-from gooddata_sp.check_return_type import check_response
+from gooddata_sp.check_return_type import check_response, json_response
 from gooddata_sp.dependencies import (
     GoodDataServiceDep,
-    UnpackedProvisioningRequestDep,
-    UnpackedUnprovisioningRequestDep,
-    UnpackedUpdateAclRequestDep,
+    UnpackedGoodDataProvisioningRequestDep,
+    UnpackedGoodDataUnprovisioningRequestDep,
+    UnpackedGoodDataUpdateAclRequestDep,
 )
 from gooddata_sp.models.api_models import (
     ProvisioningStatus,
@@ -21,7 +23,6 @@ from gooddata_sp.models.api_models import (
     ValidationResult,
     ValidationStatus,
 )
-from gooddata_sp.models.gooddata import GoodDataOutputPort
 from gooddata_sp.utility.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,27 +34,23 @@ logger = get_logger(__name__)
     responses={"200": {"model": ValidationResult}, "500": {"model": SystemErr}},
     tags=["SpecificProvisioner"],
 )
-def validate(request: UnpackedProvisioningRequestDep, service: GoodDataServiceDep) -> Response:
+async def validate(request: UnpackedGoodDataProvisioningRequestDep, service: GoodDataServiceDep) -> Response:
     """
     Validate a provisioning request
     """
 
     if isinstance(request, ValidationError):
-        return check_response(ValidationResult(valid=False,
-                                               error=request))
+        return json_response(ValidationResult(valid=False, error=request))
 
-    data_product, component_id = request
+    data_product, component = request
 
-    component = data_product.get_typed_component_by_id(component_id, GoodDataOutputPort)
-    logger.info("Validating component with id: " + component_id)
-    logger.debug("Validating component: " + str(component))
+    logger.info("Validating component with id: %s", component.id)
+    logger.debug("Validating component: %s", component)
 
-    if isinstance(component, GoodDataOutputPort):
-        resp = service.validate(component, data_product)
-    else:
-        resp = ValidationResult(valid=False,
-                                error=ValidationError(errors=["Component is not of expected type."]))
+    resp = await asyncio.to_thread(service.validate, component, data_product)
 
+    if isinstance(resp, ValidationResult):
+        return json_response(resp)
     return check_response(out_response=resp)
 
 @app.post(
@@ -67,7 +64,7 @@ def validate(request: UnpackedProvisioningRequestDep, service: GoodDataServiceDe
     },
     tags=["SpecificProvisioner"],
 )
-def provision(request: UnpackedProvisioningRequestDep, service: GoodDataServiceDep) -> Response:
+async def provision(request: UnpackedGoodDataProvisioningRequestDep, service: GoodDataServiceDep) -> Response:
     """
     Deploy a data product or a single component starting from a provisioning descriptor
     """
@@ -75,17 +72,15 @@ def provision(request: UnpackedProvisioningRequestDep, service: GoodDataServiceD
     if isinstance(request, ValidationError):
         return check_response(out_response=request)
 
-    data_product, component_id = request
+    data_product, component = request
 
-    component = data_product.get_typed_component_by_id(component_id, GoodDataOutputPort)
-    logger.info("Provisioning component with id: " + component_id)
-    logger.debug("Provisioning component: " + str(component))
+    logger.info("Provisioning component with id: %s", component.id)
+    logger.debug("Provisioning component: %s", component)
 
-    if isinstance(component, GoodDataOutputPort):
-        resp = service.provision(component, data_product)
-    else:
-        resp = ValidationError(errors=["Component is not of expected type."])
+    resp = await asyncio.to_thread(service.provision, component, data_product)
 
+    if isinstance(resp, ProvisioningStatus):
+        return json_response(resp)
     return check_response(out_response=resp)
 
 
@@ -100,7 +95,7 @@ def provision(request: UnpackedProvisioningRequestDep, service: GoodDataServiceD
     },
     tags=["SpecificProvisioner"],
 )
-def unprovision(request: UnpackedUnprovisioningRequestDep, service: GoodDataServiceDep) -> Response:
+async def unprovision(request: UnpackedGoodDataUnprovisioningRequestDep, service: GoodDataServiceDep) -> Response:
     """
     Undeploy a data product or a single component
     given the provisioning descriptor relative to the latest complete provisioning request
@@ -109,17 +104,15 @@ def unprovision(request: UnpackedUnprovisioningRequestDep, service: GoodDataServ
     if isinstance(request, ValidationError):
         return check_response(out_response=request)
 
-    data_product, component_id, remove_data = request
+    data_product, component, remove_data = request
 
-    component = data_product.get_typed_component_by_id(component_id, GoodDataOutputPort)
-    logger.info("Unprovisioning component with id: " + component_id)
-    logger.debug("Unprovisioning component: " + str(component))
+    logger.info("Unprovisioning component with id: %s", component.id)
+    logger.debug("Unprovisioning component: %s", component)
 
-    if isinstance(component, GoodDataOutputPort):
-        resp = service.unprovision(component, data_product, remove_data)
-    else:
-        resp = ValidationError(errors=["Component is not of expected type."])
+    resp = await asyncio.to_thread(service.unprovision, component, data_product, remove_data)
 
+    if isinstance(resp, ProvisioningStatus):
+        return json_response(resp)
     return check_response(out_response=resp)
 
 
@@ -134,21 +127,24 @@ def unprovision(request: UnpackedUnprovisioningRequestDep, service: GoodDataServ
     },
     tags=["SpecificProvisioner"],
 )
-def runReverseProvisioning(request: ReverseProvisioningRequest, service: GoodDataServiceDep) -> Response:
+async def runReverseProvisioning(request: ReverseProvisioningRequest, service: GoodDataServiceDep) -> Response:
     """
     Undeploy a data product or a single component
     given the provisioning descriptor relative to the latest complete provisioning request
     """  # noqa: E501
 
-    logger.info("Reverse provisioning for template: " + str(request.useCaseTemplateId))
-    logger.info("Environment: " + str(request.environment))
-    logger.info("Parameters: " + str(request.params))
+    logger.info("Reverse provisioning for template: %s", request.useCaseTemplateId)
+    logger.info("Environment: %s", request.environment)
+    logger.info("Parameters: %s", request.params)
 
-    resp = service.reverse_provision(request.useCaseTemplateId,
-                                     request.environment,
-                                     request.params,
-                                     request.catalogInfo)
+    resp = await asyncio.to_thread(service.reverse_provision,
+                                   request.useCaseTemplateId,
+                                   request.environment,
+                                   request.params,
+                                   request.catalogInfo)
 
+    if isinstance(resp, ReverseProvisioningStatus):
+        return json_response(resp)
     return check_response(out_response=resp)
 
 
@@ -163,7 +159,7 @@ def runReverseProvisioning(request: ReverseProvisioningRequest, service: GoodDat
     },
     tags=["SpecificProvisioner"],
 )
-def updateacl(request: UnpackedUpdateAclRequestDep, service: GoodDataServiceDep) -> Response:
+async def updateacl(request: UnpackedGoodDataUpdateAclRequestDep, service: GoodDataServiceDep) -> Response:
     """
     Request the access to a specific provisioner component
     """
@@ -171,17 +167,15 @@ def updateacl(request: UnpackedUpdateAclRequestDep, service: GoodDataServiceDep)
     if isinstance(request, ValidationError):
         return check_response(out_response=request)
 
-    data_product, component_id, witboost_users = request
+    data_product, component, witboost_users = request
 
-    component = data_product.get_typed_component_by_id(component_id, GoodDataOutputPort)
-    logger.info("Updating ACL for component with id: " + component_id)
-    logger.debug("Updating ACL for component: " + str(component))
+    logger.info("Updating ACL for component with id: %s", component.id)
+    logger.debug("Updating ACL for component: %s", component)
 
-    if isinstance(component, GoodDataOutputPort):
-        resp = service.update_acl(component, data_product, witboost_users)
-    else:
-        resp = ValidationError(errors=["Component is not of expected type."])
+    resp = await asyncio.to_thread(service.update_acl, component, data_product, witboost_users)
 
+    if isinstance(resp, ProvisioningStatus):
+        return json_response(resp)
     return check_response(out_response=resp)
 
 
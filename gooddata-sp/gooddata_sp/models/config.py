@@ -1,13 +1,15 @@
 
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel, ConfigDict, SecretStr
 
 
 class GoodDataConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     host: str
     token: SecretStr
 
 
 class SnowflakeConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     user: str
     role: str
     password: SecretStr
@@ -17,5 +19,6 @@ class SnowflakeConfig(BaseModel):
 
 
 class SpecificProvisionerConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     gooddata_config: GoodDataConfig
     snowflake_config: SnowflakeConfig
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import StrEnum
-from typing import Annotated, List, Literal, Optional, Type
+from typing import Annotated, Dict, List, Literal, Optional, Type, TypeVar
 
 from pydantic import (
     AnyUrl,
@@ -8,15 +8,20 @@ from pydantic import (
     BeforeValidator,
     ConfigDict,
     Field,
+    TypeAdapter,
     field_validator,
     model_validator,
 )
 
+from gooddata_sp.models.api_models import ValidationError
 from gooddata_sp.models.constants import OPENMETADATA_SUPPORTED_DATATYPES
 from gooddata_sp.utility.logger import get_logger
+from gooddata_sp.utility.parsing_pydantic_models import parse_yaml_with_adapter
 
 logger = get_logger(__name__)
 
+T = TypeVar("T", bound=BaseModel)
+
 
 class CaseInsensitiveStrEnum(StrEnum):
     # make enum case insensitive
@@ -138,6 +143,16 @@ class Component(BaseModel):
     tags: List[OpenMetadataTagLabel]
     specific: dict
 
+    def _parse_specific(self, adapter: TypeAdapter[T], model: Type[T]) -> T | ValidationError:
+        # memoized together with the specific section it was parsed from, so that a copy with a different one
+        # (e.g. model_copy(update={"specific": ...})) is parsed again; kept in __dict__ directly as pydantic
+        # doesn't allow setting undeclared attributes
+        cached = self.__dict__.get("_specific_cache")
+        if cached is None or cached[0] is not self.specific:
+            cached = (self.specific, parse_yaml_with_adapter(self.specific, adapter, model))
+            self.__dict__["_specific_cache"] = cached
+        return cached[1]
+
 
 class OutputPort(Component):
     model_config = ConfigDict(extra="allow")
@@ -347,17 +362,38 @@ class DataProduct(BaseModel):
            ... else:
            ...     print("Component not found.")
         """  # noqa: E501
-        for component in self.components:
-            if component.id == component_id:
-                return component
-        return None
+        return self._get_components_by_id().get(component_id)
+
+    def _get_components_by_id(self) -> Dict[str, Component]:
+        # built on first lookup and kept together with the components list it indexes, so that a copy with other
+        # components (e.g. model_copy(update={"components": ...})) builds its own; kept in __dict__ directly as
+        # pydantic doesn't allow setting undeclared attributes
+        cached = self.__dict__.get("_components_by_id")
+        if cached is None or cached[0] is not self.components:
+            # reversed so that the first component wins on duplicated ids, as a scan would
+            cached = (self.components, {component.id: component for component in reversed(self.components)})
+            self.__dict__["_components_by_id"] = cached
+        return cached[1]
+
+    def get_typed_component_by_id(self, component_id: str, component_type: Type[T]) -> T:
+        """
+        Retrieve a component within the data product by its unique identifier, parsed as the given type.
+
+        Args:
+            component_id (str): The unique identifier of the component to retrieve.
+            component_type (Type[T]): The model the component must be parsed as.
+
+        Returns:
+            T: The component with the specified ID as an instance of component_type.
 
-    def get_typed_component_by_id(self, component_id: str, component_type: Type[BaseModel]):
+        Raises:
+            ValueError: If no component with the specified ID exists, or if it cannot be
+            parsed as component_type (pydantic's ValidationError is a ValueError).
+        """  # noqa: E501
         component = self.get_component_by_id(component_id)
-        if component is not None:
-            return component_type.parse_obj(component.dict(by_alias=True))
-        else:
-            return None
+        if component is None:
+            raise ValueError("Component " + component_id + " not found in the data product")
+        return component_type.parse_obj(component.dict(by_alias=True))
 
     def get_output_ports(self) -> List[OutputPort]:
         """
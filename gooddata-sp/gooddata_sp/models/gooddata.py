@@ -1,13 +1,13 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from gooddata_sp.models.api_models import ValidationError
 from gooddata_sp.models.data_product_descriptor import DataContract, OutputPort
-from gooddata_sp.utility.parsing_pydantic_models import parse_yaml_with_model
 
 
 class UserDataFilter(BaseModel):
+    model_config = ConfigDict(frozen=True)
     user: str
     label: str
     value: str
@@ -17,6 +17,7 @@ class UserDataFilter(BaseModel):
 
 
 class GoodDataOutputPortSpecificSection(BaseModel):
+    model_config = ConfigDict(frozen=True)
     workspaceId: str
     workspaceName: str
     workspaceLayout: dict
@@ -24,8 +25,11 @@ class GoodDataOutputPortSpecificSection(BaseModel):
     userDataFilters: Optional[List[UserDataFilter]] = None
 
 
+_GOODDATA_SPEC_ADAPTER = TypeAdapter(GoodDataOutputPortSpecificSection)
+
+
 class GoodDataOutputPort(OutputPort):
     dataContract: DataContract
 
     def get_specific(self) -> GoodDataOutputPortSpecificSection | ValidationError:
-        return parse_yaml_with_model(self.specific, GoodDataOutputPortSpecificSection)
+        return self._parse_specific(_GOODDATA_SPEC_ADAPTER, GoodDataOutputPortSpecificSection)
@@ -1,98 +1,112 @@
-from abc import ABC, abstractmethod
 from enum import StrEnum
-from typing import List
+from typing import List, Literal, Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from gooddata_sp.models.api_models import ValidationError
 from gooddata_sp.models.data_product_descriptor import (
-    Component,
     DataContract,
     OpenMetadataColumn,
     OutputPort,
     StorageArea,
 )
-from gooddata_sp.utility.parsing_pydantic_models import parse_yaml_with_model
 
 
 class TableAndSchema(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     tableName: str
     schema_: List[OpenMetadataColumn] = Field(..., alias="schema")
 
 
 class SnowflakeStorageAreaSpecificSection(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     tables: List[TableAndSchema]
     database: str
     schema_: str = Field(..., alias="schema")
 
 
 class SnowflakeOutputPortSpecificSection(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     viewName: str
     tableName: str
     database: str
     schema_: str = Field(..., alias="schema")
 
 
+_STORAGE_AREA_SPEC_ADAPTER = TypeAdapter(SnowflakeStorageAreaSpecificSection)
+_OUTPUT_PORT_SPEC_ADAPTER = TypeAdapter(SnowflakeOutputPortSpecificSection)
+
+
+# kept for callers comparing against the enum; SnowflakeObject.type is a plain literal
 class SnowflakeObjectType(StrEnum):
     TABLE = "TABLE"
     VIEW = "VIEW"
 
 
 class SnowflakeObject(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     name: str
     schema_: List[OpenMetadataColumn] = Field(..., alias="schema")
-    type: SnowflakeObjectType
+    type: Literal["TABLE", "VIEW"]
 
 
 class SnowflakeMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     database: str
     schema_: str = Field(..., alias="schema")
     objects: List[SnowflakeObject]
 
 
-class SnowflakeComponent(ABC, Component):
-    @abstractmethod
+class SnowflakeComponent(Protocol):
+    """
+    Structural type of the Snowflake components a GoodData Output Port can depend on.
+    """
+    id: str
+    name: str
+
     def get_snowflake_metadata(self) -> SnowflakeMetadata | ValidationError:
-        pass
+        ...
 
 
-class SnowflakeStorageArea(StorageArea, SnowflakeComponent):
+class SnowflakeStorageArea(StorageArea):
 
     def get_specific(self) -> SnowflakeStorageAreaSpecificSection | ValidationError:
-        return parse_yaml_with_model(self.specific, SnowflakeStorageAreaSpecificSection)
+        return self._parse_specific(_STORAGE_AREA_SPEC_ADAPTER, SnowflakeStorageAreaSpecificSection)
 
     def get_snowflake_metadata(self) -> SnowflakeMetadata | ValidationError:
         specific = self.get_specific()
         if isinstance(specific, ValidationError):
             return specific
 
-        objects = map(
-            lambda table: SnowflakeObject(name=table.tableName, schema=table.schema_, type=SnowflakeObjectType.TABLE),
-            specific.tables
-        )
+        # every input was already validated as part of the specific section, no need to validate again
+        objects = [
+            SnowflakeObject.model_construct(name=table.tableName, schema_=table.schema_, type="TABLE")
+            for table in specific.tables
+        ]
 
-        return SnowflakeMetadata(database=specific.database,
-                                 schema=specific.schema_,
-                                 objects=objects)
+        return SnowflakeMetadata.model_construct(database=specific.database,
+                                                 schema_=specific.schema_,
+                                                 objects=objects)
 
 
-class SnowflakeOutputPort(OutputPort, SnowflakeComponent):
+class SnowflakeOutputPort(OutputPort):
     dataContract: DataContract
 
     def get_specific(self) -> SnowflakeOutputPortSpecificSection | ValidationError:
-        return parse_yaml_with_model(self.specific, SnowflakeOutputPortSpecificSection)
+        return self._parse_specific(_OUTPUT_PORT_SPEC_ADAPTER, SnowflakeOutputPortSpecificSection)
 
     def get_snowflake_metadata(self) -> SnowflakeMetadata | ValidationError:
         specific = self.get_specific()
         if isinstance(specific, ValidationError):
             return specific
 
+        # every input was already validated as part of the specific section or the data contract
         objects = [
-            SnowflakeObject(name=specific.viewName,
-                            schema=self.dataContract.schema_,
-                            type=SnowflakeObjectType.VIEW)
+            SnowflakeObject.model_construct(name=specific.viewName,
+                                            schema_=self.dataContract.schema_,
+                                            type="VIEW")
         ]
 
-        return SnowflakeMetadata(database=specific.database,
-                                 schema=specific.schema_,
-                                 objects=objects)
+        return SnowflakeMetadata.model_construct(database=specific.database,
+                                                 schema_=specific.schema_,
+                                                 objects=objects)
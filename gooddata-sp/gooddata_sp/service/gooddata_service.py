@@ -1,5 +1,10 @@
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from textwrap import shorten
-from typing import Dict, List, Optional, Tuple
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
 
 from gooddata_sdk import CatalogDeclarativeWorkspaceModel
 
@@ -23,18 +28,51 @@ from gooddata_sp.utility.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_WORKSPACE_MODEL_CACHE_SIZE = 8
+
+# (kind, use case template) of the Snowflake components a GoodData Output Port can depend on
+_SNOWFLAKE_DEPS: frozenset[tuple[ComponentKind, str]] = frozenset({
+    (ComponentKind.OUTPUTPORT, "urn:dmb:utm:snowflake-outputport-template:0.0.0"),
+    (ComponentKind.STORAGE, "urn:dmb:utm:snowflake-storage-template:0.0.0"),
+})
+# model each kind of Snowflake dependency is parsed as
+_SNOWFLAKE_KIND_TYPES: dict[ComponentKind, type[SnowflakeStorageArea] | type[SnowflakeOutputPort]] = {
+    ComponentKind.STORAGE: SnowflakeStorageArea,
+    ComponentKind.OUTPUTPORT: SnowflakeOutputPort,
+}
+
+
+class _Shortened:
+    """
+    Log argument rendering an object shortened to 1024 characters, only if the record is emitted.
+    """
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any):
+        self._obj = obj
+
+    def __str__(self) -> str:
+        return shorten(str(self._obj), 1024)
+
 
 class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
 
     _gooddata_client: GoodDataClient
 
-    def __init__(self, gooddata_client: GoodDataClient):
+    def __init__(self,
+                 gooddata_client: GoodDataClient,
+                 workspace_model_cache_size: int = DEFAULT_WORKSPACE_MODEL_CACHE_SIZE):
         self._gooddata_client = gooddata_client
+        self._workspace_model_cache_size = workspace_model_cache_size
+        self._workspace_models: OrderedDict[str, CatalogDeclarativeWorkspaceModel] = OrderedDict()
+        self._workspace_models_lock = Lock()
+        # the host is fixed by the configuration, so the dashboards URL prefix is built once
+        self._dashboards_url_prefix = f"{gooddata_client.get_host().rstrip('/')}/dashboards/#/workspace/"
 
     def validate(self,
                  component: GoodDataOutputPort,
                  data_product: DataProduct) -> ValidationResult | SystemErr:
-        logger.info("Validating component: " + shorten(str(component), 1024))
+        logger.info("Validating component: %s", _Shortened(component))
 
         specific_section = component.get_specific()
         if isinstance(specific_section, ValidationError):
@@ -47,13 +85,14 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
             # basic validation
             # round trip from dict to model back to dict, check that everything is equal
             # if not it means the original dict was likely bad
-            contents = CatalogDeclarativeWorkspaceModel.from_dict(specific_section.workspaceLayout)
+            contents = self._parse_workspace_layout(specific_section.workspaceLayout)
             contents_dict = contents.to_dict()
             if specific_section.workspaceLayout == contents_dict:
-                logger.info("Workspace contents: " + shorten(str(contents), 1024))
+                logger.info("Workspace contents: %s", _Shortened(contents))
             else:
                 return ValidationResult(valid=False, error=ValidationError(errors=["Workspace content is not valid."]))
-        except Exception as ex:
+        # what parsing a bad layout raises (the API client's errors subclass these); anything else is a bug
+        except (ValueError, TypeError, KeyError, AttributeError) as ex:
             return ValidationResult(valid=False,
                                     error=ValidationError(errors=["Unable to parse the workspace content.", str(ex)]))
 
@@ -62,7 +101,7 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
     def provision(self,
                   component: GoodDataOutputPort,
                   data_product: DataProduct) -> ProvisioningStatus | ValidationError | SystemErr:
-        logger.info("Provisioning component: " + shorten(str(component), 1024))
+        logger.info("Provisioning component: %s", _Shortened(component))
 
         specific_section = component.get_specific()
         if isinstance(specific_section, ValidationError):
@@ -78,19 +117,20 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
                                    + mapped_owner_developers.errors)
         dp_owner_gooddata_id, dp_developers_gooddata_id = mapped_owner_developers
 
-        if self._gooddata_client.workspace_exists(workspace_id):
-            logger.info("Skipping workspace creation as workspace " + workspace_id + " already exists")
+        workspace_existed = self._gooddata_client.workspace_exists(workspace_id)
+        if workspace_existed:
+            logger.info("Skipping workspace creation as workspace %s already exists", workspace_id)
         else:
-            logger.info("Creating workspace " + workspace_id)
+            logger.info("Creating workspace %s", workspace_id)
             self._gooddata_client.create_workspace(workspace_id,
                                                    specific_section.workspaceName,
                                                    specific_section.parentWorkspaceId)
 
         # populate content, data source, ldm only if it is not a child workspace
         if specific_section.parentWorkspaceId is None:
-            workspace_content = CatalogDeclarativeWorkspaceModel.from_dict(specific_section.workspaceLayout)
+            workspace_content = self._parse_workspace_layout(specific_section.workspaceLayout)
 
-            logger.info("Importing content to workspace " + workspace_id)
+            logger.info("Importing content to workspace %s", workspace_id)
             self._gooddata_client.import_workspace(workspace_id, workspace_content)
 
             logger.info("Looking for Snowflake dependency...")
@@ -106,22 +146,27 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
             else:
                 logger.info("No Snowflake component found; skipping provisioning of Data Source and LDM")
 
-        logger.info("Applying MANAGE permissions to workspace " + workspace_id + " for DP owner and dev group")
-        self._gooddata_client.add_or_update_workspace_permissions(user_ids=[dp_owner_gooddata_id],
-                                                                  group_ids=[dp_developers_gooddata_id],
-                                                                  workspace_id=workspace_id,
-                                                                  level='MANAGE')
+        # permissions and user data filters don't depend on each other, so they are updated concurrently
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            logger.info("Applying MANAGE permissions to workspace %s for DP owner and dev group", workspace_id)
+            permissions_update = executor.submit(self._gooddata_client.add_or_update_workspace_permissions,
+                                                 user_ids=[dp_owner_gooddata_id],
+                                                 group_ids=[dp_developers_gooddata_id],
+                                                 workspace_id=workspace_id,
+                                                 level='MANAGE')
+
+            # replaces the existing filters, so it also removes them when none are defined;
+            # a workspace that was just created has no filters to remove
+            user_data_filters = specific_section.userDataFilters or []
+            if workspace_existed or user_data_filters:
+                logger.info("Setting User Data Filters of workspace %s", workspace_id)
+                self._gooddata_client.set_user_data_filters(user_data_filters=user_data_filters,
+                                                            workspace_id=workspace_id)
+            else:
+                logger.info("No User Data Filters defined for new workspace %s, skipping applying UDF",
+                            workspace_id)
 
-        logger.info("Removing existing User Data Filters from workspace " + workspace_id)
-        self._gooddata_client.remove_user_data_filters(workspace_id)
-
-        if specific_section.userDataFilters is not None:
-            logger.info("Applying new User Data Filters to workspace " + workspace_id)
-            for user_data_filter in specific_section.userDataFilters:
-                logger.info("Applying User Data Filter " + str(user_data_filter) + " to workspace " + workspace_id)
-                self._gooddata_client.add_user_data_filter(user_data_filter=user_data_filter, workspace_id=workspace_id)
-        else:
-            logger.info("No User Data Filters defined for workspace " + workspace_id + ", skipping applying UDF")
+            permissions_update.result()
 
         return ProvisioningStatus(
             status=Status1.COMPLETED,
@@ -143,7 +188,7 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
                     component: GoodDataOutputPort,
                     data_product: DataProduct,
                     remove_data: bool) -> ProvisioningStatus | ValidationError | SystemErr:
-        logger.info("Unprovisioning component: " + shorten(str(component), 1024))
+        logger.info("Unprovisioning component: %s", _Shortened(component))
 
         specific_section = component.get_specific()
         if isinstance(specific_section, ValidationError):
@@ -153,12 +198,12 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
 
         if self._gooddata_client.workspace_exists(id):
             if remove_data:
-                logger.info("Emptying workspace " + id + " as remove_data is true")
+                logger.info("Emptying workspace %s as remove_data is true", id)
                 self._gooddata_client.empty_workspace(id)
             else:
-                logger.info("Not emptying workspace " + id + " as remove_data is false")
+                logger.info("Not emptying workspace %s as remove_data is false", id)
 
-            logger.info("Removing all permissions on workspace " + id)
+            logger.info("Removing all permissions on workspace %s", id)
             self._gooddata_client.remove_workspace_permissions(workspace_id=id)
 
             return ProvisioningStatus(
@@ -166,7 +211,7 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
                 result="Unprovisioning completed",
             )
         else:
-            logger.info("Skipping unprovisioning as workspace " + id + " does not exist")
+            logger.info("Skipping unprovisioning as workspace %s does not exist", id)
 
             return ProvisioningStatus(
                 status=Status1.COMPLETED,
@@ -179,7 +224,7 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
                           parameters: Optional[Dict],
                           catalog_info: Optional[Dict])\
             -> ReverseProvisioningStatus | RequestValidationError | SystemErr:
-        logger.info("Reverse provisioning for parameters: " + shorten(str(parameters), 1024))
+        logger.info("Reverse provisioning for parameters: %s", _Shortened(parameters))
 
         if parameters is None:
             return RequestValidationError(
@@ -207,7 +252,7 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
             )
 
         if self._gooddata_client.workspace_exists(id):
-            logger.info("Exporting content from workspace " + id)
+            logger.info("Exporting content from workspace %s", id)
             content = self._gooddata_client.export_workspace(id)
 
             return ReverseProvisioningStatus(
@@ -236,7 +281,7 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
                    component: GoodDataOutputPort,
                    data_product: DataProduct,
                    refs: list[str]) -> ProvisioningStatus | ValidationError | SystemErr:
-        logger.info("Update ACL for component: " + shorten(str(component), 1024))
+        logger.info("Update ACL for component: %s", _Shortened(component))
 
         specific_section = component.get_specific()
         if isinstance(specific_section, ValidationError):
@@ -246,32 +291,32 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
         id = specific_section.workspaceId
 
         if self._gooddata_client.workspace_exists(id):
-            logger.info("Removing all permissions on workspace " + id)
+            logger.info("Removing all permissions on workspace %s", id)
             self._gooddata_client.remove_workspace_permissions(workspace_id=id)
 
-            mapped_owner_developers = self._map_dp_owner_dev_group(data_product)
-            if isinstance(mapped_owner_developers, ValidationError):
+            user_refs: List[str] = []
+            group_refs: List[str] = []
+            for ref in refs:
+                if ref.startswith("user:"):
+                    user_refs.append(ref)
+                elif ref.startswith("group:"):
+                    group_refs.append(ref)
+            mapped_identities = self._map_identities(data_product, user_refs=user_refs, group_refs=group_refs)
+            if isinstance(mapped_identities, ValidationError):
                 return ValidationError(errors=["Unable to map DP owner and/or developer group to GoodData ids."]
-                                              + mapped_owner_developers.errors)
-            dp_owner_gooddata_id, dp_developers_gooddata_id = mapped_owner_developers
+                                              + mapped_identities.errors)
+            dp_owner_gooddata_id, dp_developers_gooddata_id, mapped_users, mapped_groups = mapped_identities
 
-            logger.info("Applying MANAGE permissions to workspace " + id + " for DP owner and dev group")
+            logger.info("Applying MANAGE permissions to workspace %s for DP owner and dev group", id)
             self._gooddata_client.add_or_update_workspace_permissions(user_ids=[dp_owner_gooddata_id],
                                                                       group_ids=[dp_developers_gooddata_id],
                                                                       workspace_id=id,
                                                                       level='MANAGE')
 
-            user_refs = [user_ref for user_ref in refs if user_ref.startswith("user:")]
-            mapped_users = self._gooddata_client.map_users(witboost_users=user_refs)
-            valid_users = [v for k, v in mapped_users.items() if v is not None]
-            invalid_users = [k for k, v in mapped_users.items() if v is None]
-
-            group_refs = [group_ref for group_ref in refs if group_ref.startswith("group:")]
-            mapped_groups = self._gooddata_client.map_groups(witboost_groups=group_refs)
-            valid_groups = [v for k, v in mapped_groups.items() if v is not None]
-            invalid_groups = [k for k, v in mapped_groups.items() if v is None]
+            valid_users, invalid_users = self._partition_mapped_identities(mapped_users)
+            valid_groups, invalid_groups = self._partition_mapped_identities(mapped_groups)
 
-            logger.info("Applying VIEW permissions to workspace " + id + " for consumers")
+            logger.info("Applying VIEW permissions to workspace %s for consumers", id)
             self._gooddata_client.add_or_update_workspace_permissions(user_ids=valid_users,
                                                                       group_ids=valid_groups,
                                                                       workspace_id=id,
@@ -294,11 +339,45 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
                 result="Update ACL failed, workspace " + id + " does not exist."
             )
 
+    @staticmethod
+    def _partition_mapped_identities(mapped_identities: Dict[str, str | None]) -> Tuple[List[str], List[str]]:
+        # splits in a single pass into the mapped GoodData ids and the witboost identities that couldn't be mapped
+        valid: List[str] = []
+        invalid: List[str] = []
+        for witboost_identity, gooddata_id in mapped_identities.items():
+            if gooddata_id is None:
+                invalid.append(witboost_identity)
+            else:
+                valid.append(gooddata_id)
+        return valid, invalid
+
+    def _parse_workspace_layout(self, workspace_layout: dict) -> CatalogDeclarativeWorkspaceModel:
+        # validate and provision of the same descriptor come in as separate requests, so the models
+        # of the most recently seen layouts are kept; they are only ever read, never modified.
+        # Layouts with values JSON can't represent (e.g. YAML dates) are not cached, since stringifying
+        # them would make them collide with the plain strings
+        try:
+            key = json.dumps(workspace_layout, sort_keys=True)
+        except TypeError:
+            return CatalogDeclarativeWorkspaceModel.from_dict(workspace_layout)
+        with self._workspace_models_lock:
+            workspace_model = self._workspace_models.get(key)
+            if workspace_model is not None:
+                self._workspace_models.move_to_end(key)
+                return workspace_model
+
+        workspace_model = CatalogDeclarativeWorkspaceModel.from_dict(workspace_layout)
+        with self._workspace_models_lock:
+            self._workspace_models[key] = workspace_model
+            if len(self._workspace_models) > self._workspace_model_cache_size:
+                self._workspace_models.popitem(last=False)
+        return workspace_model
+
     def _get_url(self, id: str) -> str:
-        return self._gooddata_client.get_host() + "/dashboards/#/workspace/" + id + "/"
+        return f"{self._dashboards_url_prefix}{id}/"
 
     @staticmethod
-    def _compute_data_source_id(component: Component, dependent_component: Component) -> str:
+    def _compute_data_source_id(component: Component, dependent_component: SnowflakeComponent) -> str:
         component_id = component.id
         dependent_component_id = dependent_component.id
         prefix = component_id.split(":")[3:]
@@ -307,21 +386,21 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
         data_source_id = "_".join(prefix + base + suffix)
         return data_source_id
 
-    def _compute_data_source_name(self, component: Component, dependent_component: Component) -> str:
+    def _compute_data_source_name(self, component: Component, dependent_component: SnowflakeComponent) -> str:
         component_fully_qualified_name = component.fullyQualifiedName
         if component_fully_qualified_name is None:
             component_fully_qualified_name = self._compute_fully_qualified_name(component)
         dependent_component_name = dependent_component.name
-        data_source_name = component_fully_qualified_name + " - Data Source - " + dependent_component_name
+        data_source_name = f"{component_fully_qualified_name} - Data Source - {dependent_component_name}"
         return data_source_name
 
     def _compute_fully_qualified_name(self, component: Component) -> str:
         component_id = component.id
-        pieces = component_id.split(":")
-        domain = self._rebuild_name_from_normalized_string(pieces[3])
-        data_product_name = self._rebuild_name_from_normalized_string(pieces[4])
-        data_product_major_version = pieces[5]
-        return domain + " - " + data_product_name + " - V" + data_product_major_version + " - " + component.name
+        # urn:dmb:cmp:<domain>:<data product>:<major version>:<component>, nothing past the version is needed
+        _, _, _, domain_raw, data_product_raw, data_product_major_version, *_ = component_id.split(":", 6)
+        domain = self._rebuild_name_from_normalized_string(domain_raw)
+        data_product_name = self._rebuild_name_from_normalized_string(data_product_raw)
+        return f"{domain} - {data_product_name} - V{data_product_major_version} - {component.name}"
 
     def _provision_data_source_and_ldm(self,
                                        component: GoodDataOutputPort,
@@ -340,13 +419,13 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
 
         data_source_id = self._compute_data_source_id(component, snowflake_component)
         data_source_name = self._compute_data_source_name(component, snowflake_component)
-        logger.info("Creating data source " + data_source_id)
+        logger.info("Creating data source %s", data_source_id)
         data_source = self._gooddata_client.create_snowflake_datasource(id=data_source_id,
                                                                         name=data_source_name,
                                                                         database=snowflake_metadata.database,
                                                                         schema=snowflake_metadata.schema_)
 
-        logger.info("Applying USE permissions to data source " + data_source_id + " for DP owner and dev group")
+        logger.info("Applying USE permissions to data source %s for DP owner and dev group", data_source_id)
         self._gooddata_client.set_data_source_permissions(user_ids=[dp_owner_gooddata_id],
                                                           group_ids=[dp_developers_gooddata_id],
                                                           data_source_id=data_source_id,
@@ -355,16 +434,17 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
         ldm = workspace_content.ldm
         ldm_exists = ldm is not None and (len(ldm.datasets) > 0 or len(ldm.date_instances) > 0)
         if ldm_exists:
-            logger.info("Skipping generating LDM for data source " + data_source_id + " as workspace " + workspace_id +
-                        " already has an LDM")
+            logger.info("Skipping generating LDM for data source %s as workspace %s already has an LDM",
+                        data_source_id, workspace_id)
         else:
-            logger.info("Generating LDM for data source " + data_source_id +
-                        " and applying it to workspace " + workspace_id)
+            logger.info("Generating LDM for data source %s and applying it to workspace %s",
+                        data_source_id, workspace_id)
             self._gooddata_client.generate_ldm_and_apply_to_workspace(data_source=data_source,
                                                                       workspace_id=workspace_id,
                                                                       snowflake_metadata=snowflake_metadata)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _rebuild_name_from_normalized_string(normalized: str) -> str:
         return normalized.replace("-", " ").title()
 
@@ -379,12 +459,7 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
         dependent_components = [data_product.get_component_by_id(dep_id) for dep_id in dependent_component_ids]
         snowflake_dependent_components = [
             dep_cmp for dep_cmp in dependent_components
-            if dep_cmp is not None
-               and (dep_cmp.kind == ComponentKind.OUTPUTPORT
-                    and dep_cmp.useCaseTemplateId == "urn:dmb:utm:snowflake-outputport-template:0.0.0"
-                    or
-                    dep_cmp.kind == ComponentKind.STORAGE
-                    and dep_cmp.useCaseTemplateId == "urn:dmb:utm:snowflake-storage-template:0.0.0")
+            if dep_cmp is not None and (dep_cmp.kind, dep_cmp.useCaseTemplateId) in _SNOWFLAKE_DEPS
         ]
         return snowflake_dependent_components
 
@@ -403,38 +478,44 @@ class GoodDataService(SpecificProvisionerService[GoodDataOutputPort]):
                                            "component (Storage Area or Output Port) but has " +
                                            str(num_snowflake_components) + ": " + str(snowflake_dependent_components)])
 
-        dependent_component_id = snowflake_dependent_components[0].id
+        # already looked up by _find_snowflake_dependencies, only the typed parsing is left
+        dependent_component = snowflake_dependent_components[0]
+        dependent_component_id = dependent_component.id
 
-        dependent_component = data_product.get_component_by_id(dependent_component_id)
-        if dependent_component is None:  # can't happen but makes mypy happy
-            return ValidationError(errors=[
-                "Dependency " + dependent_component_id + " was not found"])
-
-        dependent_component_kind = dependent_component.kind
-        if dependent_component_kind == ComponentKind.STORAGE:
-            snowflake_component = data_product.get_typed_component_by_id(dependent_component_id, SnowflakeStorageArea)
-        elif dependent_component_kind == ComponentKind.OUTPUTPORT:
-            snowflake_component = data_product.get_typed_component_by_id(dependent_component_id, SnowflakeOutputPort)
-        else:  # can't happen but makes mypy happy
+        snowflake_component_type = _SNOWFLAKE_KIND_TYPES.get(dependent_component.kind)
+        if snowflake_component_type is None:  # can't happen but makes mypy happy
             return ValidationError(errors=[
                 "Dependency " + dependent_component_id +
                 " must be a Snowflake component but is neither a Storage Area nor an Output Port"])
 
+        snowflake_component: SnowflakeComponent = data_product.get_typed_component_by_id(dependent_component_id,
+                                                                                         snowflake_component_type)
         return snowflake_component
 
     def _map_dp_owner_dev_group(self, data_product: DataProduct) -> Tuple[str, str] | ValidationError:
+        mapped_identities = self._map_identities(data_product, user_refs=[], group_refs=[])
+        if isinstance(mapped_identities, ValidationError):
+            return mapped_identities
+        dp_owner_gooddata_id, dp_developers_gooddata_id, _, _ = mapped_identities
+        return dp_owner_gooddata_id, dp_developers_gooddata_id
+
+    def _map_identities(self, data_product: DataProduct, user_refs: List[str], group_refs: List[str]) \
+            -> Tuple[str, str, Dict[str, str | None], Dict[str, str | None]] | ValidationError:
+        # map the DP owner and dev group together with the given refs, one client call per identity kind
         dp_owner = data_product.dataProductOwner
-        dp_owner_gooddata_id = self._gooddata_client \
-            .map_users([dp_owner]) \
-            .get(dp_owner)
+        dev_group = data_product.devGroup
+        mapped_users = self._gooddata_client.map_users([dp_owner, *user_refs])
+        mapped_groups = self._gooddata_client.map_groups([dev_group, *group_refs])
+
+        dp_owner_gooddata_id = mapped_users.get(dp_owner)
         if dp_owner_gooddata_id is None:
             return ValidationError(errors=["Unable to map DP owner \"" + dp_owner + "\" to a GoodData user."])
 
-        dev_group = data_product.devGroup
-        dp_developers_gooddata_id = self._gooddata_client \
-            .map_groups([dev_group]) \
-            .get(dev_group)
+        dp_developers_gooddata_id = mapped_groups.get(dev_group)
         if dp_developers_gooddata_id is None:
             return ValidationError(errors=["Unable to map DP dev group \"" + dev_group + "\" to a GoodData group."])
 
-        return dp_owner_gooddata_id, dp_developers_gooddata_id
\ No newline at end of file
+        return (dp_owner_gooddata_id,
+                dp_developers_gooddata_id,
+                {user_ref: mapped_users[user_ref] for user_ref in user_refs},
+                {group_ref: mapped_groups[group_ref] for group_ref in group_refs})
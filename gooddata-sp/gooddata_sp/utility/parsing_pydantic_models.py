@@ -1,17 +1,30 @@
-from typing import Type, TypeVar
+from typing import Any, Callable, Type, TypeVar
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from gooddata_sp.models.api_models import ValidationError
 from gooddata_sp.utility.logger import get_logger
 
 logger = get_logger()
 
+try:
+    # libyaml-backed loader, much faster than the pure Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 T = TypeVar('T', bound=BaseModel)
 
 
+def safe_load_yaml(yaml_data: str) -> Any:
+    """
+    Parse a YAML string like `yaml.safe_load`, using the libyaml-backed loader when available.
+    """
+    return yaml.load(yaml_data, Loader=SafeLoader)
+
+
 def parse_yaml_with_model(yaml_data: dict | str, model: Type[T]) -> T | ValidationError:
     """
     Parse YAML data using a Pydantic model.
@@ -55,14 +68,29 @@ def parse_yaml_with_model(yaml_data: dict | str, model: Type[T]) -> T | Validati
     Raises:
         Exception: If an unexpected error occurs during parsing.
     """  # noqa: E501
+    # Not model_validate: some models (e.g. Workload) preprocess their input in __init__
+    return _parse_yaml(yaml_data, lambda yaml_dict: model(**yaml_dict), model)
+
+
+def parse_yaml_with_adapter(yaml_data: dict | str, adapter: TypeAdapter[T], model: Type[T]) -> T | ValidationError:
+    """
+    Parse YAML data using a prebuilt Pydantic TypeAdapter.
+
+    Behaves like `parse_yaml_with_model`, but validates through an adapter built once
+    by the caller (usually at module level) and reused across calls. `model` is the type
+    the adapter validates, used to describe parsing errors.
+    """
+    return _parse_yaml(yaml_data, adapter.validate_python, model)
+
+
+def _parse_yaml(yaml_data: dict | str, parse: Callable[[Any], T], model: Any) -> T | ValidationError:
     try:
         if isinstance(yaml_data, str):
-            yaml_dict = yaml.safe_load(yaml_data)
+            yaml_dict = safe_load_yaml(yaml_data)
         else:
             yaml_dict = yaml_data
 
-        data = model(**yaml_dict)
-        return data
+        return parse(yaml_dict)
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         return ValidationError(
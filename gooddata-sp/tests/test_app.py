@@ -6,7 +6,7 @@ from pydantic import BaseModel
 from starlette.responses import Response
 from starlette.testclient import TestClient
 
-from gooddata_sp.check_return_type import check_response
+from gooddata_sp.check_return_type import check_response, json_response
 from gooddata_sp.models.api_models import SystemErr, ValidationError
 
 app2 = FastAPI()
@@ -113,3 +113,19 @@ class TestCheckResponses(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 500)
         self.assertIn("error", json.loads(response.body))
+
+    def test_check_responses_model_list(self):
+        out_response = [ValidationError(errors=["error 1"]), ValidationError(errors=["error 2"])]
+        responses = {"400": {"model": list}}
+        response = check_response(
+            application=app2, out_response=out_response, responses=responses
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(json.loads(response.body), [{"errors": ["error 1"]}, {"errors": ["error 2"]}])
+
+    def test_json_response(self):
+        response = json_response(ValidationError(errors=["error 1"]), status_code=400)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(json.loads(response.body), {"errors": ["error 1"]})
@@ -156,6 +156,22 @@ class TestDataProductDescriptor(unittest.TestCase):
         component = self.sample_data_product.get_component_by_id(component_id)
         self.assertIsNone(component)
 
+    def test_get_component_by_id_duplicated(self):
+        duplicate = self.sample_data_product.components[1].model_copy(update={"id": "op1"})
+        self.sample_data_product.components.append(duplicate)
+
+        component = self.sample_data_product.get_component_by_id("op1")
+
+        self.assertIs(component, self.sample_data_product.components[0])
+
+    def test_get_component_by_id_of_copy_with_other_components(self):
+        self.sample_data_product.get_component_by_id("op1")
+
+        copy = self.sample_data_product.model_copy(update={"components": []})
+
+        self.assertIsNone(copy.get_component_by_id("op1"))
+        self.assertIsNotNone(self.sample_data_product.get_component_by_id("op1"))
+
     def test_get_components_by_kind_outputport_with_dependencies(self):
         output_ports = self.sample_data_product.get_components_by_kind(
             ComponentKind.OUTPUTPORT
@@ -1,5 +1,6 @@
+import os
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from fastapi import FastAPI
 from starlette.testclient import TestClient
@@ -7,6 +8,9 @@ from starlette.testclient import TestClient
 from gooddata_sp.dependencies import (
     UnpackedProvisioningRequestDep,
     UnpackedUpdateAclRequestDep,
+    get_gooddata_client,
+    get_gooddata_service,
+    get_specific_provisioner_config_from_env,
     unpack_provisioning_request,
     unpack_update_acl_request,
 )
@@ -399,3 +403,58 @@ class TestAppDependenciesMock(unittest.TestCase):
         assert response.status_code == 200
         assert "Provisioning failed" in response.json()["message"]
         assert "errors" in response.json()
+
+
+class TestGetSpecificProvisionerConfigFromEnv(unittest.TestCase):
+    env = {
+        "GOODDATA_HOST": "https://gooddata.example.com",
+        "GOODDATA_TOKEN": "token",
+        "SNOWFLAKE_USER": "user",
+        "SNOWFLAKE_ROLE": "role",
+        "SNOWFLAKE_PASSWORD": "password",
+        "SNOWFLAKE_ORGANIZATION_ACCOUNT": "account",
+        "SNOWFLAKE_WAREHOUSE": "warehouse",
+    }
+
+    def setUp(self):
+        get_specific_provisioner_config_from_env.cache_clear()
+
+    def tearDown(self):
+        get_specific_provisioner_config_from_env.cache_clear()
+
+    def test_config_is_built_once(self):
+        with patch.dict(os.environ, self.env):
+            config = get_specific_provisioner_config_from_env()
+            self.assertIs(get_specific_provisioner_config_from_env(), config)
+
+        self.assertEqual(config.gooddata_config.host, "https://gooddata.example.com")
+        self.assertEqual(config.snowflake_config.port, "443")
+
+    def test_missing_env_variable(self):
+        with patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(ValueError):
+                get_specific_provisioner_config_from_env()
+
+
+class TestGoodDataServiceSingleton(unittest.TestCase):
+    def setUp(self):
+        get_gooddata_client.cache_clear()
+        get_gooddata_service.cache_clear()
+
+    def tearDown(self):
+        get_gooddata_client.cache_clear()
+        get_gooddata_service.cache_clear()
+
+    @patch("gooddata_sp.dependencies.GoodDataClient")
+    def test_client_and_service_are_shared(self, client_class):
+        with patch.dict(os.environ, TestGetSpecificProvisionerConfigFromEnv.env):
+            get_specific_provisioner_config_from_env.cache_clear()
+            config = get_specific_provisioner_config_from_env()
+        get_specific_provisioner_config_from_env.cache_clear()
+
+        client = get_gooddata_client(config)
+        self.assertIs(get_gooddata_client(config), client)
+        client_class.assert_called_once()
+
+        service = get_gooddata_service(client)
+        self.assertIs(get_gooddata_service(client), service)
@@ -0,0 +1,54 @@
+import unittest
+
+from gooddata_sp.models.api_models import ValidationError
+from gooddata_sp.models.data_product_descriptor import ComponentKind, DataContract, DataSharingAgreement
+from gooddata_sp.models.gooddata import GoodDataOutputPort, GoodDataOutputPortSpecificSection, UserDataFilter
+
+
+def build_output_port(specific: dict) -> GoodDataOutputPort:
+    return GoodDataOutputPort(
+        kind=ComponentKind.OUTPUTPORT,
+        id="urn:dmb:cmp:healthcare:vaccinations:0:gooddata-output-port",
+        name="GoodData Output Port",
+        description="GoodData Output Port",
+        infrastructureTemplateId="infra",
+        dependsOn=[],
+        tags=[],
+        specific=specific,
+        version="0.0.0",
+        outputPortType="SQL",
+        dataContract=DataContract(schema=[]),
+        dataSharingAgreement=DataSharingAgreement(),
+        semanticLinking=[],
+    )
+
+
+specific = {"workspaceId": "ws", "workspaceName": "Workspace", "workspaceLayout": {}}
+
+
+class TestGoodDataOutputPort(unittest.TestCase):
+    def test_get_specific(self):
+        udf = {"user": "user:john.doe_example.com", "label": "country", "value": "Italy", "id": "udf", "title": "UDF"}
+        output_port = build_output_port({**specific, "userDataFilters": [udf]})
+
+        specific_section = output_port.get_specific()
+
+        self.assertIsInstance(specific_section, GoodDataOutputPortSpecificSection)
+        self.assertEqual(specific_section.userDataFilters, [UserDataFilter(**udf)])
+        self.assertIs(output_port.get_specific(), specific_section)
+
+    def test_get_specific_of_copy_with_new_specific(self):
+        output_port = build_output_port(specific)
+        output_port.get_specific()
+
+        copy = output_port.model_copy(update={"specific": {**specific, "workspaceId": "other"}})
+
+        self.assertEqual(copy.get_specific().workspaceId, "other")
+        self.assertEqual(output_port.get_specific().workspaceId, "ws")
+
+    def test_get_specific_without_user_data_filters(self):
+        self.assertIsNone(build_output_port(specific).get_specific().userDataFilters)
+        self.assertIsNone(build_output_port({**specific, "userDataFilters": None}).get_specific().userDataFilters)
+
+    def test_get_specific_invalid(self):
+        self.assertIsInstance(build_output_port({"workspaceId": "ws"}).get_specific(), ValidationError)
@@ -0,0 +1,327 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gooddata_api_client import Configuration
+from gooddata_api_client.exceptions import ApiException, NotFoundException
+from gooddata_api_client.rest import RESTClientObject
+from gooddata_sdk import (
+    CatalogDataSourcePermissionAssignment,
+    CatalogPermissionAssignments,
+    CatalogUser,
+    CatalogUserGroup,
+    GoodDataSdk,
+)
+
+from gooddata_sp.client.gooddata_client import GoodDataClient, _empty_content
+from gooddata_sp.models.config import GoodDataConfig, SnowflakeConfig
+from gooddata_sp.models.gooddata import UserDataFilter
+
+gooddata_config = GoodDataConfig(host="https://gooddata.example.com/", token="token")
+snowflake_config = SnowflakeConfig(
+    user="user",
+    role="role",
+    password="password",
+    account="account",
+    warehouse="warehouse",
+    port="443",
+)
+
+
+def build_client(**kwargs) -> tuple[GoodDataClient, MagicMock]:
+    sdk = MagicMock()
+    with (
+        patch("gooddata_sp.client.gooddata_client.GoodDataSdk.create", return_value=sdk),
+        patch("gooddata_sp.client.gooddata_client.RESTClientObject"),
+    ):
+        client = GoodDataClient(gooddata_config=gooddata_config, snowflake_config=snowflake_config, **kwargs)
+    return client, sdk
+
+
+class TestMapUsersAndGroups(unittest.TestCase):
+    users = [
+        CatalogUser.init(user_id="john", email="john.doe@example.com"),
+        CatalogUser.init(user_id="jane", email="jane.doe@example.com"),
+    ]
+    groups = [
+        CatalogUserGroup.init(user_group_id="devs", user_group_name="developers"),
+    ]
+
+    def test_map_users(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_users.return_value = self.users
+
+        mapped = client.map_users(["user:john.doe_example.com", "user:missing_example.com"])
+
+        self.assertEqual(mapped, {"user:john.doe_example.com": "john", "user:missing_example.com": None})
+
+    def test_map_groups(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_user_groups.return_value = self.groups
+
+        mapped = client.map_groups(["group:developers", "group:missing"])
+
+        self.assertEqual(mapped, {"group:developers": "devs", "group:missing": None})
+
+    def test_map_users_skips_users_without_email(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_users.return_value = self.users + [CatalogUser(id="no_attributes")]
+
+        mapped = client.map_users(["user:john.doe_example.com"])
+
+        self.assertEqual(mapped, {"user:john.doe_example.com": "john"})
+
+    def test_map_users_reuses_listing(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_users.return_value = self.users
+
+        client.map_users(["user:john.doe_example.com"])
+        mapped = client.map_users(["user:jane.doe_example.com"])
+
+        self.assertEqual(mapped, {"user:jane.doe_example.com": "jane"})
+        sdk.catalog_user.list_users.assert_called_once()
+
+    def test_map_groups_reuses_listing(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_user_groups.return_value = self.groups
+
+        client.map_groups(["group:developers"])
+        client.map_groups(["group:developers"])
+
+        sdk.catalog_user.list_user_groups.assert_called_once()
+
+    def test_map_users_created_after_listing(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_users.return_value = self.users[:1]
+
+        client.map_users(["user:john.doe_example.com"])
+        sdk.catalog_user.list_users.return_value = self.users
+        mapped = client.map_users(["user:jane.doe_example.com"])
+
+        self.assertEqual(mapped, {"user:jane.doe_example.com": "jane"})
+        self.assertEqual(sdk.catalog_user.list_users.call_count, 2)
+
+    def test_map_groups_created_after_listing(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_user_groups.return_value = []
+
+        client.map_groups(["group:developers"])
+        sdk.catalog_user.list_user_groups.return_value = self.groups
+        mapped = client.map_groups(["group:developers"])
+
+        self.assertEqual(mapped, {"group:developers": "devs"})
+        self.assertEqual(sdk.catalog_user.list_user_groups.call_count, 2)
+
+    def test_map_users_after_invalidation(self):
+        client, sdk = build_client()
+        sdk.catalog_user.list_users.return_value = self.users
+
+        client.map_users(["user:john.doe_example.com"])
+        client.invalidate_user_cache()
+        client.map_users(["user:john.doe_example.com"])
+
+        self.assertEqual(sdk.catalog_user.list_users.call_count, 2)
+
+    def test_map_users_after_ttl_expiration(self):
+        client, sdk = build_client(identity_cache_ttl=0)
+        sdk.catalog_user.list_users.return_value = self.users
+
+        client.map_users(["user:john.doe_example.com"])
+        client.map_users(["user:john.doe_example.com"])
+
+        self.assertEqual(sdk.catalog_user.list_users.call_count, 2)
+
+
+class TestWorkspaceExists(unittest.TestCase):
+    def test_workspace_exists(self):
+        client, sdk = build_client()
+
+        self.assertTrue(client.workspace_exists("workspace"))
+        sdk.catalog_workspace.get_workspace.assert_called_once_with(workspace_id="workspace")
+        sdk.catalog_workspace.list_workspaces.assert_not_called()
+
+    def test_workspace_does_not_exist(self):
+        client, sdk = build_client()
+        sdk.catalog_workspace.get_workspace.side_effect = NotFoundException(status=404, reason="Not Found")
+
+        self.assertFalse(client.workspace_exists("workspace"))
+
+    def test_workspace_exists_propagates_other_errors(self):
+        client, sdk = build_client()
+        sdk.catalog_workspace.get_workspace.side_effect = ApiException(status=500, reason="Server Error")
+
+        with self.assertRaises(ApiException):
+            client.workspace_exists("workspace")
+
+
+class TestFullCatalog(unittest.TestCase):
+    def test_single_slice_loads_only_requested_entities(self):
+        client, sdk = build_client()
+
+        client.get_metrics("workspace")
+        client.get_attributes("workspace")
+        client.get_facts("workspace")
+
+        sdk.catalog_workspace_content.get_metrics_catalog.assert_called_once_with("workspace")
+        sdk.catalog_workspace_content.get_attributes_catalog.assert_called_once_with("workspace")
+        sdk.catalog_workspace_content.get_facts_catalog.assert_called_once_with("workspace")
+        sdk.catalog_workspace_content.get_full_catalog.assert_not_called()
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_connection_pool_settings(self):
+        client = GoodDataClient(
+            gooddata_config=gooddata_config,
+            snowflake_config=snowflake_config,
+            connection_pool_maxsize=8,
+            max_retries=5,
+        )
+
+        pool_manager = client._sdk.client._api_client.rest_client.pool_manager
+        self.assertEqual(pool_manager.connection_pool_kw["maxsize"], 8)
+        self.assertEqual(pool_manager.connection_pool_kw["retries"].total, 5)
+
+    def test_sdk_exposes_api_client(self):
+        # the pool configuration relies on these SDK internals, this fails if an SDK upgrade drops them
+        sdk = GoodDataSdk.create(gooddata_config.host, gooddata_config.token)
+
+        api_client = sdk.client._api_client
+        self.assertIsInstance(api_client.configuration, Configuration)
+        self.assertIsInstance(api_client.rest_client, RESTClientObject)
+
+    def test_falls_back_when_sdk_internals_change(self):
+        sdk = MagicMock()
+        sdk.client = object()
+        with (
+            patch("gooddata_sp.client.gooddata_client.GoodDataSdk.create", return_value=sdk),
+            self.assertLogs("gooddata_sp.client.gooddata_client", level="WARNING"),
+        ):
+            client = GoodDataClient(gooddata_config=gooddata_config, snowflake_config=snowflake_config)
+
+        self.assertIs(client._sdk, sdk)
+
+
+class TestSetDataSourcePermissions(unittest.TestCase):
+    def test_updates_every_principal(self):
+        client, sdk = build_client()
+        current_permissions = CatalogPermissionAssignments(
+            workspaces=[],
+            data_sources=[CatalogDataSourcePermissionAssignment(id="other", permissions=["MANAGE"])],
+        )
+        sdk.catalog_user.get_user_permissions.return_value = current_permissions
+        sdk.catalog_user.get_user_group_permissions.return_value = current_permissions
+
+        client.set_data_source_permissions("ds", user_ids=["u1", "u2"], group_ids=["g1"], level="USE")
+
+        self.assertEqual(sdk.catalog_user.manage_user_permissions.call_count, 2)
+        sdk.catalog_user.manage_user_group_permissions.assert_called_once()
+        updated = sdk.catalog_user.manage_user_group_permissions.call_args.kwargs["permission_assignments"]
+        self.assertEqual(
+            {(p.id, tuple(p.permissions)) for p in updated.data_sources},
+            {("other", ("MANAGE",)), ("ds", ("USE",))},
+        )
+
+    def test_failure_does_not_stop_other_updates(self):
+        client, sdk = build_client()
+        sdk.catalog_user.get_user_permissions.side_effect = ApiException(status=500, reason="Server Error")
+        sdk.catalog_user.get_user_group_permissions.return_value = CatalogPermissionAssignments(
+            workspaces=[], data_sources=[]
+        )
+
+        with self.assertRaises(ApiException):
+            client.set_data_source_permissions("ds", user_ids=["u1"], group_ids=["g1"], level="USE")
+
+        sdk.catalog_user.manage_user_group_permissions.assert_called_once()
+
+
+class TestEmptyWorkspace(unittest.TestCase):
+    def test_empty_workspace_reuses_empty_content(self):
+        client, sdk = build_client()
+
+        client.empty_workspace("ws1")
+        client.empty_workspace("ws2")
+
+        first, second = sdk.catalog_workspace.put_declarative_workspace.call_args_list
+        self.assertEqual(first.args[0], "ws1")
+        self.assertIs(first.args[1], second.args[1])
+        self.assertIs(first.args[1], _empty_content())
+
+
+class TestCreateSnowflakeDatasource(unittest.TestCase):
+    def test_returns_created_data_source(self):
+        client, sdk = build_client()
+
+        data_source = client.create_snowflake_datasource(id="ds", name="DS", database="DB", schema="SCHEMA")
+
+        sdk.catalog_data_source.create_or_update_data_source.assert_called_once_with(data_source=data_source)
+        sdk.catalog_data_source.get_data_source.assert_not_called()
+        self.assertEqual(data_source.id, "ds")
+        self.assertEqual(data_source.schema, "SCHEMA")
+        self.assertEqual(data_source.db_specific_attributes.db_name, "DB")
+
+    def test_refresh_reads_back_data_source(self):
+        client, sdk = build_client()
+
+        data_source = client.create_snowflake_datasource(
+            id="ds", name="DS", database="DB", schema="SCHEMA", refresh=True
+        )
+
+        sdk.catalog_data_source.get_data_source.assert_called_once_with(data_source_id="ds")
+        self.assertIs(data_source, sdk.catalog_data_source.get_data_source.return_value)
+
+
+class TestSetUserDataFilters(unittest.TestCase):
+    def build_client_with_user(self) -> tuple[GoodDataClient, MagicMock]:
+        client, sdk = build_client()
+        sdk.catalog_user.list_users.return_value = [CatalogUser.init(user_id="john", email="john.doe@example.com")]
+        return client, sdk
+
+    def test_set_user_data_filters(self):
+        client, sdk = self.build_client_with_user()
+        udfs = [
+            UserDataFilter(user="user:john.doe_example.com", label="country", value=value, id=value, title=value)
+            for value in ["Italy", "Spain", "France"]
+        ]
+
+        client.set_user_data_filters(udfs, "workspace")
+
+        sdk.catalog_workspace.put_declarative_user_data_filters.assert_called_once()
+        kwargs = sdk.catalog_workspace.put_declarative_user_data_filters.call_args.kwargs
+        self.assertEqual(kwargs["workspace_id"], "workspace")
+        user_data_filters = kwargs["user_data_filters"].user_data_filters
+        self.assertEqual([udf.id for udf in user_data_filters], ["Italy", "Spain", "France"])
+        self.assertEqual(user_data_filters[0].maql, '{label/country} = "Italy"')
+        self.assertEqual({udf.user.id for udf in user_data_filters}, {"john"})
+
+    def test_set_user_data_filters_escapes_value(self):
+        client, sdk = self.build_client_with_user()
+        udf = UserDataFilter(
+            user="user:john.doe_example.com",
+            label="name",
+            value='a "quoted" \\ value',
+            id="udf",
+            title="UDF",
+            operator="<>",
+        )
+
+        client.set_user_data_filters([udf], "workspace")
+
+        kwargs = sdk.catalog_workspace.put_declarative_user_data_filters.call_args.kwargs
+        maql = kwargs["user_data_filters"].user_data_filters[0].maql
+        self.assertEqual(maql, '{label/name} <> "a \\"quoted\\" \\\\ value"')
+
+    def test_set_user_data_filters_empty(self):
+        client, sdk = self.build_client_with_user()
+
+        client.set_user_data_filters([], "workspace")
+
+        sdk.catalog_user.list_users.assert_not_called()
+        kwargs = sdk.catalog_workspace.put_declarative_user_data_filters.call_args.kwargs
+        self.assertEqual(kwargs["user_data_filters"].user_data_filters, [])
+
+    def test_set_user_data_filters_unknown_user(self):
+        client, sdk = self.build_client_with_user()
+        udf = UserDataFilter(user="user:unknown_example.com", label="country", value="Italy", id="udf", title="UDF")
+
+        with self.assertRaises(ValueError):
+            client.set_user_data_filters([udf], "workspace")
+        sdk.catalog_workspace.put_declarative_user_data_filters.assert_not_called()
@@ -0,0 +1,187 @@
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from gooddata_sdk import CatalogDeclarativeWorkspaceModel
+
+from gooddata_sp.client.gooddata_client import GoodDataClient
+from gooddata_sp.models.api_models import Status1, ValidationError
+from gooddata_sp.models.data_product_descriptor import DataProduct
+from gooddata_sp.models.gooddata import GoodDataOutputPort
+from gooddata_sp.service.gooddata_service import GoodDataService
+from gooddata_sp.utility.parsing_pydantic_models import parse_yaml_with_model, safe_load_yaml
+
+descriptor = safe_load_yaml((Path(__file__).parent.parent / "descriptor_udf.yaml").read_text())
+component_id = descriptor["componentIdToProvision"]
+
+dp_owner = "user:nicolo.bidotti_agilelab.it"
+dev_group = "group:olive"
+
+
+def build_request():
+    data_product = parse_yaml_with_model(descriptor["dataProduct"], DataProduct)
+    component = data_product.get_typed_component_by_id(component_id, GoodDataOutputPort)
+    return data_product, component
+
+
+def build_client(users: dict, groups: dict) -> MagicMock:
+    client = MagicMock(spec=GoodDataClient)
+    client.map_users.side_effect = lambda witboost_users: {user: users.get(user) for user in witboost_users}
+    client.map_groups.side_effect = lambda witboost_groups: {group: groups.get(group) for group in witboost_groups}
+    client.get_host.return_value = "https://gooddata.example.com/"
+    return client
+
+
+class TestUpdateAcl(unittest.TestCase):
+    def setUp(self):
+        self.client = build_client(
+            users={dp_owner: "owner", "user:alice_example.com": "alice"},
+            groups={dev_group: "developers", "group:consumers": "consumers"},
+        )
+        self.client.workspace_exists.return_value = True
+        self.service = GoodDataService(gooddata_client=self.client)
+        self.data_product, self.component = build_request()
+
+    def test_update_acl(self):
+        refs = ["user:alice_example.com", "group:consumers"]
+
+        resp = self.service.update_acl(self.component, self.data_product, refs)
+
+        self.assertEqual(resp.status, Status1.COMPLETED)
+        self.client.map_users.assert_called_once_with([dp_owner, "user:alice_example.com"])
+        self.client.map_groups.assert_called_once_with([dev_group, "group:consumers"])
+        self.client.add_or_update_workspace_permissions.assert_any_call(
+            user_ids=["owner"], group_ids=["developers"], workspace_id="udf_test", level="MANAGE"
+        )
+        self.client.add_or_update_workspace_permissions.assert_any_call(
+            user_ids=["alice"], group_ids=["consumers"], workspace_id="udf_test", level="VIEW"
+        )
+
+    def test_update_acl_unmapped_refs(self):
+        refs = ["user:bob_example.com", "group:consumers", "group:unknown"]
+
+        resp = self.service.update_acl(self.component, self.data_product, refs)
+
+        self.assertEqual(resp.status, Status1.FAILED)
+        self.assertIn("['user:bob_example.com']", resp.result)
+        self.assertIn("['group:unknown']", resp.result)
+
+    def test_update_acl_unmapped_owner(self):
+        self.client.map_users.side_effect = lambda witboost_users: {user: None for user in witboost_users}
+
+        resp = self.service.update_acl(self.component, self.data_product, [])
+
+        self.assertIsInstance(resp, ValidationError)
+
+
+class TestProvision(unittest.TestCase):
+    def setUp(self):
+        self.client = build_client(users={dp_owner: "owner"}, groups={dev_group: "developers"})
+        self.client.workspace_exists.return_value = False
+        self.service = GoodDataService(gooddata_client=self.client)
+        self.data_product, self.component = build_request()
+
+    def test_provision(self):
+        resp = self.service.provision(self.component, self.data_product)
+
+        self.assertEqual(resp.status, Status1.COMPLETED)
+        self.client.create_workspace.assert_called_once()
+        self.client.import_workspace.assert_called_once()
+        self.client.add_or_update_workspace_permissions.assert_called_once_with(
+            user_ids=["owner"], group_ids=["developers"], workspace_id="udf_test", level="MANAGE"
+        )
+        self.client.set_user_data_filters.assert_called_once_with(
+            user_data_filters=self.component.get_specific().userDataFilters, workspace_id="udf_test"
+        )
+        self.assertEqual(
+            resp.info.publicInfo["link"]["href"], "https://gooddata.example.com/dashboards/#/workspace/udf_test/"
+        )
+
+    def test_provision_without_user_data_filters_clears_them(self):
+        self.client.workspace_exists.return_value = True
+        self.component.specific.pop("userDataFilters")
+
+        self.service.provision(self.component, self.data_product)
+
+        self.client.set_user_data_filters.assert_called_once_with(user_data_filters=[], workspace_id="udf_test")
+
+    def test_provision_new_workspace_without_user_data_filters(self):
+        self.component.specific.pop("userDataFilters")
+
+        resp = self.service.provision(self.component, self.data_product)
+
+        self.assertEqual(resp.status, Status1.COMPLETED)
+        self.client.workspace_exists.assert_called_once_with("udf_test")
+        self.client.set_user_data_filters.assert_not_called()
+
+    def test_provision_raises_permission_errors(self):
+        self.client.add_or_update_workspace_permissions.side_effect = RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self.service.provision(self.component, self.data_product)
+
+
+class TestValidate(unittest.TestCase):
+    def setUp(self):
+        client = build_client(users={dp_owner: "owner"}, groups={dev_group: "developers"})
+        client.workspace_exists.return_value = True
+        self.service = GoodDataService(gooddata_client=client)
+        self.data_product, self.component = build_request()
+
+    def test_validate(self):
+        resp = self.service.validate(self.component, self.data_product)
+
+        self.assertTrue(resp.valid)
+
+    def test_validate_invalid_layout(self):
+        _, component = build_request()
+        component.specific["workspaceLayout"] = {"ldm": {"datasets": [{"id": "dataset"}]}}
+
+        resp = self.service.validate(component, self.data_product)
+
+        self.assertFalse(resp.valid)
+
+    def test_validate_unexpected_error(self):
+        with patch.object(GoodDataService, "_parse_workspace_layout", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                self.service.validate(self.component, self.data_product)
+
+    def test_provision_reuses_workspace_model_parsed_by_validate(self):
+        with patch.object(
+            CatalogDeclarativeWorkspaceModel, "from_dict", wraps=CatalogDeclarativeWorkspaceModel.from_dict
+        ) as from_dict:
+            self.service.validate(self.component, self.data_product)
+            # a new request for the same descriptor builds a new component
+            data_product, component = build_request()
+            resp = self.service.provision(component, data_product)
+
+        self.assertEqual(resp.status, Status1.COMPLETED)
+        from_dict.assert_called_once()
+
+    def test_workspace_model_cache_is_bounded(self):
+        service = GoodDataService(gooddata_client=build_client(users={}, groups={}), workspace_model_cache_size=1)
+        first = service._parse_workspace_layout({})
+        service._parse_workspace_layout({"ldm": {}})
+
+        self.assertIsNot(service._parse_workspace_layout({}), first)
+
+    def test_workspace_model_cache_distinguishes_dates_from_strings(self):
+        service = GoodDataService(gooddata_client=build_client(users={}, groups={}))
+        with patch.object(CatalogDeclarativeWorkspaceModel, "from_dict", side_effect=lambda _: MagicMock()):
+            from_date = service._parse_workspace_layout({"ldm": {"created": date(2024, 1, 1)}})
+            from_string = service._parse_workspace_layout({"ldm": {"created": "2024-01-01"}})
+
+        self.assertIsNot(from_date, from_string)
+
+
+class TestNames(unittest.TestCase):
+    def test_compute_fully_qualified_name(self):
+        service = GoodDataService(gooddata_client=build_client(users={}, groups={}))
+        _, component = build_request()
+        component = component.model_copy(update={"id": "urn:dmb:cmp:health-care:vaccination-data:1:gooddata-op:extra"})
+
+        self.assertEqual(
+            service._compute_fully_qualified_name(component),
+            "Health Care - Vaccination Data - V1 - " + component.name,
+        )
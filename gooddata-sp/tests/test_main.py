@@ -1,6 +1,19 @@
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
 from starlette.testclient import TestClient
 
+from gooddata_sp.dependencies import get_gooddata_service
 from gooddata_sp.main import app
+from gooddata_sp.models.api_models import (
+    DescriptorKind,
+    ProvisioningStatus,
+    Status1,
+    ValidationError,
+    ValidationResult,
+)
+from gooddata_sp.models.gooddata import GoodDataOutputPort
 
 client = TestClient(app)
 
@@ -29,3 +42,110 @@ def test_unprovisioning():
     # resp = client.post("/v1/unprovision", json=dict(provisioning_request))
     #
     # assert "Response not yet implemented" in resp.json().get("error")
+
+
+descriptor = (Path(__file__).parent.parent / "descriptor_empty_workspace.yaml").read_text()
+component_id = "urn:dmb:cmp:healthcare:vaccinations:0:gooddata-output-port"
+
+
+class TestEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.service = Mock()
+        app.dependency_overrides[get_gooddata_service] = lambda: self.service
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_validate(self):
+        self.service.validate.return_value = ValidationResult(valid=True)
+
+        resp = client.post(
+            "/v1/validate",
+            json={"descriptorKind": DescriptorKind.COMPONENT_DESCRIPTOR, "descriptor": descriptor},
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {"valid": True, "error": None})
+        component, _ = self.service.validate.call_args.args
+        self.assertIsInstance(component, GoodDataOutputPort)
+        self.assertEqual(component.id, component_id)
+
+    def test_validate_wrong_descriptor_kind(self):
+        resp = client.post(
+            "/v1/validate",
+            json={"descriptorKind": DescriptorKind.DATAPRODUCT_DESCRIPTOR, "descriptor": descriptor},
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertFalse(resp.json()["valid"])
+        self.service.validate.assert_not_called()
+
+    def test_provision(self):
+        self.service.provision.return_value = ProvisioningStatus(status=Status1.COMPLETED, result="done")
+
+        resp = client.post(
+            "/v1/provision",
+            json={"descriptorKind": DescriptorKind.COMPONENT_DESCRIPTOR, "descriptor": descriptor},
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["status"], Status1.COMPLETED)
+
+    def test_provision_service_validation_error(self):
+        self.service.provision.return_value = ValidationError(errors=["invalid"])
+
+        resp = client.post(
+            "/v1/provision",
+            json={"descriptorKind": DescriptorKind.COMPONENT_DESCRIPTOR, "descriptor": descriptor},
+        )
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json(), {"errors": ["invalid"]})
+
+    def test_provision_unknown_component(self):
+        resp = client.post(
+            "/v1/provision",
+            json={
+                "descriptorKind": DescriptorKind.COMPONENT_DESCRIPTOR,
+                "descriptor": descriptor.replace(
+                    "componentIdToProvision: " + component_id, "componentIdToProvision: urn:dmb:cmp:unknown"
+                ),
+            },
+        )
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(
+            resp.json(),
+            {
+                "errors": [
+                    "Component is not of expected type.",
+                    "Component urn:dmb:cmp:unknown not found in the data product",
+                ]
+            },
+        )
+        self.service.provision.assert_not_called()
+
+    def test_unprovision(self):
+        self.service.unprovision.return_value = ProvisioningStatus(status=Status1.COMPLETED, result="done")
+
+        resp = client.post(
+            "/v1/unprovision",
+            json={"descriptorKind": DescriptorKind.COMPONENT_DESCRIPTOR, "descriptor": descriptor, "removeData": True},
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(self.service.unprovision.call_args.args[2])
+
+    def test_updateacl(self):
+        self.service.update_acl.return_value = ProvisioningStatus(status=Status1.COMPLETED, result="done")
+
+        resp = client.post(
+            "/v1/updateacl",
+            json={
+                "refs": ["user:john.doe_example.com"],
+                "provisionInfo": {"request": descriptor, "result": ""},
+            },
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.service.update_acl.call_args.args[2], ["user:john.doe_example.com"])
@@ -1,10 +1,16 @@
 import unittest
 
-from pydantic import BaseModel
+import pytest
+import yaml
+from pydantic import BaseModel, TypeAdapter
 
 from gooddata_sp.models.api_models import ValidationError
 from gooddata_sp.models.data_product_descriptor import DataProduct
-from gooddata_sp.utility.parsing_pydantic_models import parse_yaml_with_model
+from gooddata_sp.utility.parsing_pydantic_models import (
+    parse_yaml_with_adapter,
+    parse_yaml_with_model,
+    safe_load_yaml,
+)
 
 
 class ModelA(BaseModel):
@@ -150,3 +156,23 @@ def test_parse_invalid_data_product_yaml():
 
     result = parse_yaml_with_model(invalid_yaml_data, DataProduct)
     assert isinstance(result, ValidationError)
+
+
+def test_safe_load_yaml():
+    result = safe_load_yaml("name: John Doe\nage: 30\ntags: [a, b]\n")
+    assert result == {"name": "John Doe", "age": 30, "tags": ["a", "b"]}
+
+
+def test_safe_load_yaml_rejects_unsafe_tags():
+    with pytest.raises(yaml.YAMLError):
+        safe_load_yaml("!!python/object/apply:os.system ['echo']")
+
+
+def test_parse_yaml_with_adapter():
+    adapter = TypeAdapter(ModelA)
+
+    assert parse_yaml_with_adapter("name: John Doe\nage: 30\n", adapter, ModelA) == ModelA(name="John Doe", age=30)
+    assert parse_yaml_with_adapter({"name": "Jane Doe", "age": 31}, adapter, ModelA) == ModelA(name="Jane Doe", age=31)
+    error = parse_yaml_with_adapter({"name": "John Doe"}, adapter, ModelA)
+    assert isinstance(error, ValidationError)
+    assert f"with {ModelA} type" in error.errors[0]
@@ -0,0 +1,98 @@
+import unittest
+
+from gooddata_sp.models.api_models import ValidationError
+from gooddata_sp.models.data_product_descriptor import ComponentKind, DataContract, DataSharingAgreement
+from gooddata_sp.models.snowflake import (
+    SnowflakeMetadata,
+    SnowflakeObject,
+    SnowflakeOutputPort,
+    SnowflakeStorageArea,
+)
+
+columns = [
+    {"name": "id", "dataType": "INT", "tags": []},
+    {"name": "name", "dataType": "STRING", "tags": []},
+]
+
+
+def build_storage_area(specific: dict) -> SnowflakeStorageArea:
+    return SnowflakeStorageArea(
+        kind=ComponentKind.STORAGE,
+        id="urn:dmb:cmp:healthcare:vaccinations:0:snowflake-storage",
+        name="Snowflake Storage",
+        description="Snowflake Storage",
+        infrastructureTemplateId="infra",
+        dependsOn=[],
+        tags=[],
+        specific=specific,
+    )
+
+
+def build_output_port(specific: dict) -> SnowflakeOutputPort:
+    return SnowflakeOutputPort(
+        kind=ComponentKind.OUTPUTPORT,
+        id="urn:dmb:cmp:healthcare:vaccinations:0:snowflake-output-port",
+        name="Snowflake Output Port",
+        description="Snowflake Output Port",
+        infrastructureTemplateId="infra",
+        dependsOn=[],
+        tags=[],
+        specific=specific,
+        version="0.0.0",
+        outputPortType="SQL",
+        dataContract=DataContract(schema=columns),
+        dataSharingAgreement=DataSharingAgreement(),
+        semanticLinking=[],
+    )
+
+
+class TestSnowflakeStorageArea(unittest.TestCase):
+    def test_get_snowflake_metadata(self):
+        storage_area = build_storage_area(
+            {
+                "database": "DB",
+                "schema": "SCHEMA",
+                "tables": [
+                    {"tableName": "TABLE_A", "schema": columns},
+                    {"tableName": "TABLE_B", "schema": columns[:1]},
+                ],
+            }
+        )
+
+        metadata = storage_area.get_snowflake_metadata()
+
+        self.assertIsInstance(metadata, SnowflakeMetadata)
+        self.assertEqual(metadata.database, "DB")
+        self.assertEqual(metadata.schema_, "SCHEMA")
+        self.assertEqual([obj.name for obj in metadata.objects], ["TABLE_A", "TABLE_B"])
+        self.assertTrue(all(isinstance(obj, SnowflakeObject) for obj in metadata.objects))
+        self.assertTrue(all(obj.type == "TABLE" for obj in metadata.objects))
+        self.assertEqual([column.name for column in metadata.objects[1].schema_], ["id"])
+
+    def test_get_snowflake_metadata_invalid_specific(self):
+        storage_area = build_storage_area({"database": "DB", "schema": "SCHEMA"})
+
+        self.assertIsInstance(storage_area.get_snowflake_metadata(), ValidationError)
+
+
+class TestSnowflakeOutputPort(unittest.TestCase):
+    def test_get_snowflake_metadata(self):
+        output_port = build_output_port(
+            {"database": "DB", "schema": "SCHEMA", "viewName": "VIEW_A", "tableName": "TABLE_A"}
+        )
+
+        metadata = output_port.get_snowflake_metadata()
+
+        self.assertIsInstance(metadata, SnowflakeMetadata)
+        self.assertEqual(len(metadata.objects), 1)
+        self.assertEqual(metadata.objects[0].name, "VIEW_A")
+        self.assertEqual(metadata.objects[0].type, "VIEW")
+        self.assertEqual([column.name for column in metadata.objects[0].schema_], ["id", "name"])
+
+    def test_get_specific_is_memoized(self):
+        output_port = build_output_port(
+            {"database": "DB", "schema": "SCHEMA", "viewName": "VIEW_A", "tableName": "TABLE_A"}
+        )
+
+        self.assertIs(output_port.get_specific(), output_port.get_specific())
+        self.assertNotIn("_specific_cache", output_port.model_dump())